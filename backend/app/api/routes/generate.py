@@ -1,22 +1,44 @@
-"""Generate Podcast API Route
+"""Generate Podcast API Routes
 
-This module provides the REST endpoint for generating podcast scripts.
-It connects the frontend to the script generation service.
+This module provides the REST endpoints for generating podcast scripts.
+It connects the frontend to the background script generation worker.
 
 Flow:
     1. Frontend sends POST /api/generate with topic and duration
-    2. Script generator researches via MCP and writes script
-    3. Returns the generated script to the frontend
-
-Note: This is a synchronous endpoint for simplicity. In production,
-you'd want to use background tasks (Celery) for long-running generations.
+    2. The request is enqueued as a Celery job and a job_id is returned immediately
+    3. A worker researches via MCP and writes the script
+    4. Frontend polls GET /api/generate/{job_id} until the job succeeds or fails
+
+Streaming alternative:
+    GET /api/generate/stream?topic=...&duration_minutes=... runs generation
+    in the API process and streams it as Server-Sent Events, so the script
+    appears as Claude writes it:
+        event: tool   data: {"tool": "search_papers"}   (research progress)
+        event: delta  data: {"delta": "Welcome to..."}  (script text)
+        event: done   data: {"word_count": 750}
+        event: error  data: {"detail": "..."}
+
+Note: Generation takes tens of seconds, so the job endpoints never hold
+the HTTP request for it. Run a worker alongside the API:
+    uv run celery -A app.workers.celery_app worker --loglevel=info
 """
 
+import logging
+from collections.abc import AsyncIterator
+from typing import Annotated, Literal
+
+import orjson
+from celery.result import AsyncResult
 from pydantic import BaseModel, Field
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query, status
+from sse_starlette import EventSourceResponse
+
+from app.services.script_generator import stream_script
+from app.workers.celery_app import celery_app
+from app.workers.tasks import generate_script_task
 
-from app.services.script_generator import generate_script
 
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api", tags=["generate"])
 
@@ -24,14 +46,23 @@ router = APIRouter(prefix="/api", tags=["generate"])
 class GenerateRequest(BaseModel):
     """Request body for podcast generation."""
 
-    topic: str = Field(..., min_length=1, description="The research topic")
+    topic: str = Field(
+        ...,
+        min_length=1,
+        max_length=200,
+        # Words, spaces and common punctuation only (no newlines/markup),
+        # checked in pydantic-core before any research work starts. Allows
+        # e.g. "C#", "100% accuracy" and quoted titles.
+        pattern=r"""^[\w \-+.,:;'"?!()/&#%]+$""",
+        description="The research topic",
+    )
     duration_minutes: int = Field(
         default=5, ge=1, le=30, description="Target duration in minutes"
     )
 
 
 class GenerateResponse(BaseModel):
-    """Response body containing the generated script."""
+    """Generated script and its metadata."""
 
     topic: str
     duration_minutes: int
@@ -39,43 +70,155 @@ class GenerateResponse(BaseModel):
     word_count: int
 
 
-@router.post("/generate", response_model=GenerateResponse)
-async def generate_podcast(request: GenerateRequest) -> GenerateResponse:
-    """Generate a podcast script for the given topic.
+class GenerateJobResponse(BaseModel):
+    """Response body returned when a generation job is enqueued."""
+
+    job_id: str
+
+
+class GenerateStatusResponse(BaseModel):
+    """Response body describing the state of a generation job."""
+
+    job_id: str
+    status: Literal["pending", "running", "succeeded", "failed"]
+    result: GenerateResponse | None = None
+    error: str | None = None
+
+
+# Celery task states → the simpler states exposed to the frontend
+_STATUS_MAP = {
+    "PENDING": "pending",
+    "RECEIVED": "pending",
+    "RETRY": "pending",
+    "STARTED": "running",
+    "SUCCESS": "succeeded",
+    "FAILURE": "failed",
+    "REVOKED": "failed",
+}
+
 
-    This endpoint:
-    1. Searches arXiv for relevant papers using MCP
-    2. Downloads and reads paper content
-    3. Generates an engaging podcast script
+@router.post(
+    "/generate",
+    response_model=GenerateJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+def generate_podcast(request: GenerateRequest) -> GenerateJobResponse:
+    """Enqueue a podcast script generation job.
+
+    Declared as a sync route so the blocking broker publish runs in
+    FastAPI's threadpool instead of on the event loop.
 
     Args:
         request: Contains topic and duration_minutes
 
     Returns:
-        GenerateResponse with the script and metadata
+        GenerateJobResponse with the job_id to poll
 
     Raises:
-        HTTPException: If generation fails
+        HTTPException: If the job cannot be enqueued (e.g., Redis is down)
     """
     try:
-        print(f"\n🎙️ Generating podcast: '{request.topic}' ({request.duration_minutes} min)")
+        task = generate_script_task.delay(request.topic, request.duration_minutes)
+    except Exception:
+        logger.exception("Failed to enqueue generation")
+        raise HTTPException(status_code=503, detail="Job queue unavailable")
+
+    logger.info(
+        "Queued podcast: %r (%d min) as job %s",
+        request.topic,
+        request.duration_minutes,
+        task.id,
+    )
 
-        script = await generate_script(
-            topic=request.topic,
-            duration_minutes=request.duration_minutes,
-        )
+    return GenerateJobResponse(job_id=task.id)
+
+
+@router.get("/generate/stream")
+async def stream_podcast(
+    request: Annotated[GenerateRequest, Query()],
+) -> EventSourceResponse:
+    """Generate a podcast script, streaming it as Server-Sent Events.
+
+    Uses GET with query parameters so browsers can consume it with a
+    plain EventSource. A keepalive ping is sent every 15s so proxies
+    don't drop the connection during the research phase.
+
+    Research uses the process-wide arXiv MCP server started at app
+    startup (borrowed per generation, see mcp_client.acquire_mcp).
+
+    Args:
+        request: Contains topic and duration_minutes (as query parameters)
 
-        word_count = len(script.split())
+    Returns:
+        EventSourceResponse emitting tool, delta, done and error events
+    """
+    logger.info("Streaming podcast: %r (%d min)", request.topic, request.duration_minutes)
+
+    return EventSourceResponse(_stream_events(request), ping=15)
 
-        print(f"✅ Generated {word_count} words")
 
-        return GenerateResponse(
+async def _stream_events(request: GenerateRequest) -> AsyncIterator[dict]:
+    """Translate script generation events into SSE messages."""
+    parts: list[str] = []
+
+    try:
+        async for event in stream_script(
             topic=request.topic,
             duration_minutes=request.duration_minutes,
-            script=script,
-            word_count=word_count,
-        )
+        ):
+            if event.type == "tool":
+                yield {"event": "tool", "data": _json({"tool": event.data})}
+            else:
+                parts.append(event.data)
+                yield {"event": "delta", "data": _json({"delta": event.data})}
 
     except Exception as e:
-        print(f"❌ Generation failed: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        # Headers are already sent, so errors are reported in-band
+        logger.exception("Streaming generation failed")
+        yield {"event": "error", "data": _json({"detail": str(e)})}
+        return
+
+    # Deltas can split words, so count on the assembled script
+    word_count = len("".join(parts).split())
+
+    logger.info("Streamed %d words", word_count)
+    yield {"event": "done", "data": _json({"word_count": word_count})}
+
+
+def _json(payload: dict) -> str:
+    """Serialize an SSE event payload (orjson; one call per script delta)."""
+    return orjson.dumps(payload).decode()
+
+
+@router.get("/generate/{job_id}", response_model=GenerateStatusResponse)
+def get_generation_status(job_id: str) -> GenerateStatusResponse:
+    """Get the status (and result, once finished) of a generation job.
+
+    Note: Celery reports unknown job IDs as PENDING, so a mistyped ID
+    looks like a job that hasn't started yet.
+
+    Args:
+        job_id: ID returned by POST /api/generate
+
+    Returns:
+        GenerateStatusResponse with the job state, plus the script on
+        success or the error message on failure
+    """
+    task = AsyncResult(job_id, app=celery_app)
+    job_status = _STATUS_MAP.get(task.state, "pending")
+
+    if job_status == "succeeded":
+        return GenerateStatusResponse(
+            job_id=job_id,
+            status=job_status,
+            result=GenerateResponse(**task.result),
+        )
+
+    if job_status == "failed":
+        return GenerateStatusResponse(
+            job_id=job_id,
+            status=job_status,
+            error=str(task.result),
+        )
+
+    return GenerateStatusResponse(job_id=job_id, status=job_status)
@@ -12,10 +12,17 @@ Usage:
     # Generate with custom duration (minutes)
     uv run python -m app.cli generate "quantum computing" --duration 10
 
+    # Bypass the on-disk arXiv search cache (fresh search results)
+    uv run python -m app.cli generate "machine learning" --no-cache
+
+    # Show research progress (tool calls and their results)
+    uv run python -m app.cli --verbose generate "machine learning"
+
 Flow (Agentic):
     1. Claude researches the topic using arXiv MCP server
     2. Claude generates a podcast script from the research
-    3. (Optional) ElevenLabs converts script to audio
+    3. (Optional) ElevenLabs converts script to audio, starting on the
+       first sentences while the rest of the script is still being written
 
 Dependencies:
     - click: CLI framework
@@ -27,16 +34,27 @@ import asyncio
 from datetime import datetime
 from pathlib import Path
 
+import aiofiles
 import click
 
-from app.services.script_generator import generate_script
-from app.services.audio_generator import generate_audio
+from app.core.logging import configure_logging
+from app.services.mcp_client import close_mcp
+from app.services.research.rate_limit import close_rate_limit
+from app.services.script_generator import generate_script, stream_script_sentences
+from app.services.audio_generator import generate_audio_stream
 
 
 @click.group()
-def cli():
+@click.option(
+    "--verbose",
+    "-v",
+    is_flag=True,
+    default=False,
+    help="Log research progress: tool calls and their results",
+)
+def cli(verbose: bool):
     """Podcast Generator CLI."""
-    pass
+    configure_logging("DEBUG" if verbose else None)
 
 
 @cli.command()
@@ -55,7 +73,13 @@ def cli():
     default=False,
     help="Generate audio with ElevenLabs (default: script only)",
 )
-def generate(topic: str, duration: int | None, audio: bool):
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    default=False,
+    help="Ignore the on-disk cache of arXiv search results and search again",
+)
+def generate(topic: str, duration: int | None, audio: bool, no_cache: bool):
     """Generate a podcast episode on TOPIC.
 
     By default, generates only the script (saved as markdown).
@@ -65,55 +89,83 @@ def generate(topic: str, duration: int | None, audio: bool):
         uv run python -m app.cli generate "machine learning"
         uv run python -m app.cli generate "SAM3" --audio --duration 5
     """
-    asyncio.run(_generate_podcast(topic, duration, audio))
+    asyncio.run(_run_cli(_generate_podcast(topic, duration, audio, use_cache=not no_cache)))
+
+
+async def _run_cli(coro):
+    """Run a command's coroutine, then release the shared MCP server and Redis client."""
+    try:
+        return await coro
+    finally:
+        await close_mcp()
+        await close_rate_limit()
 
 
-async def _generate_podcast(topic: str, duration: int | None, generate_audio_flag: bool):
+async def _generate_podcast(
+    topic: str,
+    duration: int | None,
+    generate_audio_flag: bool,
+    use_cache: bool = True,
+):
     """Async implementation of podcast generation pipeline.
 
     This orchestrates the agentic flow:
     1. Claude researches + writes script (using arXiv MCP server)
-    2. (Optional) ElevenLabs generates audio
+    2. Script is saved as markdown
+    3. (Optional) ElevenLabs generates audio. This is pipelined with step 1:
+       the script is streamed sentence by sentence and TTS starts on the
+       first chunk while Claude is still writing the rest.
 
     Args:
         topic: Topic to generate podcast about
         duration: Target duration in minutes (or None for default)
         generate_audio_flag: Whether to generate audio (default: False)
+        use_cache: Whether to reuse cached arXiv search results
     """
     click.echo(f"🎙️  Generating podcast on: {topic}")
     click.echo("=" * 50)
 
-    # Step 1: Agentic research + script generation
-    click.echo("\n🤖 Researching & generating script...")
-    click.echo("   (Claude is searching arXiv and writing the script)")
-    script = await generate_script(topic, duration_minutes=duration)
-    word_count = len(script.split())
-    click.echo(f"   Generated {word_count} words (~{word_count // 150} minutes)")
-
-    # Save script to markdown file
+    # Output paths
     scripts_dir = Path("scripts")
     scripts_dir.mkdir(exist_ok=True)
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     safe_topic = topic.replace(" ", "_").replace("/", "-")
-    script_filename = f"{safe_topic}_{timestamp}.md"
-    script_path = scripts_dir / script_filename
+    script_path = scripts_dir / f"{safe_topic}_{timestamp}.md"
+    audio_filename = f"{safe_topic}_{timestamp}.mp3"
 
-    with open(script_path, "w") as f:
-        f.write(f"# Podcast Script: {topic}\n\n")
-        f.write(f"*Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n\n")
-        f.write(f"*Duration: ~{word_count // 150} minutes ({word_count} words)*\n\n")
-        f.write("---\n\n")
-        f.write(script)
-
-    click.echo(f"\n📝 Script saved to: {script_path}")
+    # Step 1: Agentic research + script generation
+    click.echo("\n🤖 Researching & generating script...")
+    click.echo("   (Claude is searching arXiv and writing the script)")
 
-    # Step 2: Generate audio (optional)
-    if generate_audio_flag:
-        click.echo("\n🔊 Generating audio...")
-        audio_filename = f"{safe_topic}_{timestamp}.mp3"
-        audio_path = await generate_audio(script, audio_filename)
+    if not generate_audio_flag:
+        script = await generate_script(topic, duration_minutes=duration, use_cache=use_cache)
+        await _save_script(script_path, topic, script)
+    else:
+        click.echo("\n🔊 Generating audio as the script is written...")
+        script_parts: list[str] = []
+        script_done = asyncio.Event()
+
+        async def script_sentences():
+            # Tee: collect the script while feeding sentences to TTS
+            async for sentence in stream_script_sentences(
+                topic, duration_minutes=duration, use_cache=use_cache
+            ):
+                script_parts.append(sentence)
+                yield sentence
+            script_done.set()
+
+        # Steps 2 + 3: the markdown is saved as soon as the script is
+        # complete, while the last audio chunks are still being synthesized
+        async with asyncio.TaskGroup() as tg:
+            audio_task = tg.create_task(
+                generate_audio_stream(script_sentences(), audio_filename)
+            )
+            await script_done.wait()
+            await _save_script(script_path, topic, "".join(script_parts))
+
+        audio_path = audio_task.result()
         file_size = audio_path.stat().st_size / (1024 * 1024)  # MB
-        click.echo(f"   Saved to: {audio_path}")
+        click.echo(f"   Audio saved to: {audio_path}")
         click.echo(f"   File size: {file_size:.1f} MB")
 
     # Done
@@ -124,5 +176,36 @@ async def _generate_podcast(topic: str, duration: int | None, generate_audio_fla
         click.echo(f"   Audio: {audio_path}")
 
 
+async def _save_script(script_path: Path, topic: str, script: str):
+    """Report the script's length and save it as markdown."""
+    word_count = len(script.split())
+    click.echo(f"   Generated {word_count} words (~{word_count // 150} minutes)")
+
+    await _write_script_md(script_path, topic, word_count, script)
+    click.echo(f"\n📝 Script saved to: {script_path}")
+
+
+async def _write_script_md(script_path: Path, topic: str, word_count: int, script: str):
+    """Save a script as a markdown file with a small metadata header.
+
+    Written with aiofiles so the file I/O doesn't block the event loop.
+
+    Args:
+        script_path: Where to write the markdown file
+        topic: Podcast topic (used in the title)
+        word_count: Number of words in the script
+        script: The script text
+    """
+    header = (
+        f"# Podcast Script: {topic}\n\n"
+        f"*Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n\n"
+        f"*Duration: ~{word_count // 150} minutes ({word_count} words)*\n\n"
+        "---\n\n"
+    )
+
+    async with aiofiles.open(script_path, "w") as f:
+        await f.write(header + script)
+
+
 if __name__ == "__main__":
     cli()
@@ -12,6 +12,9 @@ class Settings(BaseSettings):
 
     # LLM API (using Anthropic for script generation)
     anthropic_api_key: str = ""
+    # Research via Programmatic Tool Calling (beta): Claude calls the arXiv
+    # tools from sandboxed code, so full papers never enter its context
+    programmatic_tool_calling: bool = False
 
     # Text-to-Speech (ElevenLabs)
     elevenlabs_api_key: str = ""
@@ -21,8 +24,38 @@ class Settings(BaseSettings):
     podcast_duration_minutes: int = 5
     audio_output_dir: str = "audio"
 
+    # arXiv request budget (arXiv asks for at most 1 request per 3 seconds,
+    # one at a time). The rate is shared by all processes through Redis;
+    # the concurrency cap applies per process
+    arxiv_rate_limit_requests: int = 1
+    arxiv_rate_limit_period_s: float = 3.0
+    arxiv_max_concurrent_requests: int = 1
+
+    # On-disk cache for MCP search_papers results during generation
+    # (research/search_cache.py; the CLI's --no-cache bypasses it)
+    search_cache_path: str = "cache/search_cache.sqlite3"
+    search_cache_ttl_s: int = 60 * 60 * 24  # 24 hours
+
+    # Timeouts for external calls (seconds); timed-out calls are retried
+    mcp_timeout_s: int = 30
+    llm_timeout_s: int = 120
+    timeout_max_retries: int = 2
+
+    # Background jobs (Celery broker + result backend)
+    redis_url: str = "redis://localhost:6379/0"
+
+    # Research result cache (stored in Redis) for ArxivSource searches
+    # (research/cache.py); separate from the search cache above and not
+    # affected by --no-cache
+    research_cache_enabled: bool = True
+    research_cache_ttl_s: int = 60 * 60  # 1 hour
+
+    # API
+    cors_origins: list[str] = ["http://localhost:5173"]  # Vite dev server
+
     # Development
     debug: bool = False
+    log_level: str = "INFO"
 
 
 # Singleton instance - import this throughout the app
@@ -0,0 +1,81 @@
+"""Logging configuration.
+
+Sets up the `app` logger hierarchy (every module uses
+logging.getLogger(__name__)) and routes uvicorn's loggers through the
+same handler and format.
+
+Usage:
+    from app.core.logging import configure_logging
+
+    configure_logging()  # Once, at process startup
+    configure_logging("DEBUG")  # Or with an explicit level (e.g. CLI --verbose)
+
+Notes:
+    - Level comes from settings.log_level (DEBUG when settings.debug is on)
+    - Use lazy %-style arguments, e.g. logger.info("Topic: %s", topic), so
+      messages below the active level are never formatted
+    - The message itself is still formatted on the calling thread
+      (QueueHandler.prepare() merges msg and args before queueing); a
+      background thread (QueueListener) adds the LOG_FORMAT prefix and
+      does the write, so a slow or contended stdout never blocks the
+      event loop
+"""
+
+import atexit
+import logging.config
+import logging.handlers
+import queue
+
+from app.core.config import settings
+
+
+LOG_FORMAT = "%(asctime)s %(levelname)-8s %(name)s: %(message)s"
+
+# Background thread writing queued records to the console
+_listener: logging.handlers.QueueListener | None = None
+
+
+def configure_logging(level: str | None = None) -> None:
+    """Apply the logging configuration for the app and uvicorn.
+
+    Args:
+        level: Level for the app loggers. Defaults to settings.log_level
+               (DEBUG when settings.debug is on).
+    """
+    global _listener
+    level = (level or ("DEBUG" if settings.debug else settings.log_level)).upper()
+
+    # The console handler runs on the listener thread; reconfiguring
+    # replaces the previous listener
+    console = logging.StreamHandler()
+    console.setFormatter(logging.Formatter(LOG_FORMAT))
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue()
+
+    _stop_listener()
+    _listener = logging.handlers.QueueListener(log_queue, console)
+    _listener.start()
+
+    logging.config.dictConfig(
+        {
+            "version": 1,
+            # Keep loggers uvicorn/celery created before this runs
+            "disable_existing_loggers": False,
+            "handlers": {
+                "queue": {"()": logging.handlers.QueueHandler, "queue": log_queue},
+            },
+            "loggers": {
+                "app": {"handlers": ["queue"], "level": level, "propagate": False},
+                "uvicorn": {"handlers": ["queue"], "level": "INFO", "propagate": False},
+                "uvicorn.access": {"handlers": ["queue"], "level": "INFO", "propagate": False},
+            },
+        }
+    )
+
+
+@atexit.register
+def _stop_listener() -> None:
+    """Flush the queued records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
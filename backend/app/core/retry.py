@@ -0,0 +1,62 @@
+"""Timeout + retry helper for external calls.
+
+External calls (MCP tool calls) can hang on a stuck subprocess or
+connection. Wrapping them here bounds how long a single call can hold a
+worker, and retries transient stalls with backoff. Claude API calls
+don't go through here; the Anthropic client has its own timeout and
+retries.
+
+Usage:
+    from app.core.retry import retry_on_timeout
+
+    result = await retry_on_timeout(
+        lambda: session.call_tool("search_papers", args),
+        timeout_s=30,
+        max_retries=2,
+    )
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from contextlib import AbstractAsyncContextManager, nullcontext
+from typing import TypeVar
+
+
+T = TypeVar("T")
+
+
+async def retry_on_timeout(
+    call: Callable[[], Awaitable[T]],
+    timeout_s: float,
+    max_retries: int,
+    backoff_s: float = 1.0,
+    slot: Callable[[], AbstractAsyncContextManager[object]] | None = None,
+) -> T:
+    """Await call() with a timeout, retrying with exponential backoff.
+
+    Args:
+        call: Zero-argument function returning a fresh awaitable per attempt
+        timeout_s: Timeout for each attempt, in seconds
+        max_retries: Retries after the first attempt times out
+        backoff_s: Delay before the first retry; doubles on each retry
+        slot: Optional context manager factory entered around each attempt
+              (e.g. a rate limit). It is held for that attempt only, and
+              time spent waiting for it isn't counted against timeout_s.
+
+    Returns:
+        The result of the first attempt that finishes in time
+
+    Raises:
+        TimeoutError: If every attempt times out
+    """
+    for attempt in range(max_retries + 1):
+        try:
+            async with slot() if slot else nullcontext():
+                async with asyncio.timeout(timeout_s):
+                    return await call()
+        except TimeoutError:
+            if attempt == max_retries:
+                raise
+            await asyncio.sleep(backoff_s * 2**attempt)
+
+    raise AssertionError("unreachable")
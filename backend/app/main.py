@@ -1,22 +1,64 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.api.routes.generate import router as generate_router
+from app.core.config import settings
+from app.core.logging import configure_logging
+from app.services.mcp_client import acquire_mcp, close_mcp
+from app.services.research.cache import close_cache
+from app.services.research.rate_limit import close_rate_limit
+from app.services.research.sources.arxiv import close_client as close_arxiv_client
+
+
+configure_logging()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start shared resources on startup and release them on shutdown.
+
+    The process-wide arXiv MCP server (see mcp_client.acquire_mcp) is
+    started here and shared by all requests, instead of spawning a
+    subprocess per generation. It is stopped on shutdown, together with
+    the pooled arXiv HTTP client and the research cache and rate-limit
+    Redis connections.
+    Starting the MCP server here means the first request doesn't pay for
+    its startup handshake and tool discovery.
+    """
+    # Start the MCP server now. Requests borrow it per generation through
+    # acquire_mcp() rather than holding on to it, so a crashed server is
+    # replaced on the next request.
+    async with acquire_mcp():
+        pass
+
+    try:
+        yield
+    finally:
+        await close_mcp()
+        await close_arxiv_client()
+        await close_cache()
+        await close_rate_limit()
+
 
 app = FastAPI(
     title="Podcast Generator API",
     description="Generates personalized learning podcasts",
     version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,  # Faster JSON encoding for script payloads
 )
 
 # CORS middleware - allows frontend to call backend
-# In production, restrict origins to your actual domain
+# In production, set CORS_ORIGINS to your actual domain
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["http://localhost:5173"],  # Vite dev server
+    allow_origins=settings.cors_origins,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["Content-Type"],
 )
 
 # Register routes
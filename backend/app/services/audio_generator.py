@@ -4,33 +4,74 @@ This module converts text scripts to audio using the ElevenLabs API.
 
 Flow:
     1. Receives a text script
-    2. Sends text to ElevenLabs TTS API
-    3. Receives audio stream
-    4. Saves to MP3 file
+    2. Splits it into chunks on paragraph/sentence boundaries
+    3. Sends the chunks to ElevenLabs TTS API concurrently
+    4. Concatenates the MP3 chunks in order and saves to a single file
 
 Usage:
-    from app.services.audio_generator import generate_audio
+    from app.services.audio_generator import generate_audio, generate_audio_stream
 
     audio_path = await generate_audio(
         text="Hello, welcome to the podcast...",
         output_filename="episode_001.mp3"
     )
 
+    # Pipelined: synthesize chunks while the script is still being generated
+    audio_path = await generate_audio_stream(
+        stream_script_sentences("machine learning"),
+        output_filename="episode_002.mp3",
+    )
+
 Dependencies:
-    - elevenlabs: Official ElevenLabs Python SDK
+    - elevenlabs: Official ElevenLabs Python SDK (async client)
+    - aiofiles: Non-blocking file writes
     - app.core.config: For API key, voice ID, and output directory
+    - app.services.script_generator: For the sentence boundary pattern
 
 Notes:
-    - ElevenLabs has character limits per request (~5000 chars for most plans)
-    - Long scripts may need chunking (not implemented yet - future enhancement)
+    - ElevenLabs has character limits per request (~5000 chars for most plans),
+      so scripts are chunked to MAX_CHUNK_CHARS and synthesized in parallel
+    - Each chunk is sent with its neighbours' text (previous_text/next_text)
+      so prosody stays continuous across chunk boundaries
+    - Every chunk uses the same voice/model/format, so the MP3 frames can
+      simply be concatenated into one valid stream
     - Audio is saved as MP3 format
 """
 
+import asyncio
+from collections.abc import AsyncIterable
+from functools import lru_cache
 from pathlib import Path
 
-from elevenlabs import ElevenLabs
+import aiofiles
+from elevenlabs import AsyncElevenLabs
 
 from app.core.config import settings
+from app.services.script_generator import SENTENCE_END
+
+
+# Characters per TTS request (kept well under the ElevenLabs per-request limit)
+MAX_CHUNK_CHARS = 3500
+
+# Concurrent TTS requests per generation (respects ElevenLabs rate limits)
+MAX_CONCURRENT_TTS_REQUESTS = 4
+
+MODEL_ID = "eleven_multilingual_v2"  # High quality multilingual model
+
+# Output directory, created once at import rather than on every call
+_OUTPUT_DIR = Path(settings.audio_output_dir)
+_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+
+
+@lru_cache(maxsize=1)
+def _get_client() -> AsyncElevenLabs:
+    """Return the process-wide ElevenLabs client.
+
+    Created lazily (once per process) so every generation reuses the
+    client's keepalive connection pool instead of opening a fresh
+    TCP+TLS connection per podcast.
+    """
+    return AsyncElevenLabs(api_key=settings.elevenlabs_api_key)
 
 
 async def generate_audio(
@@ -41,7 +82,10 @@ async def generate_audio(
     """Convert text to speech and save as MP3.
 
     Uses ElevenLabs API to generate natural-sounding speech from text.
-    The audio is saved to the configured output directory.
+    Long scripts are split into chunks that are synthesized concurrently,
+    so total latency is roughly that of the slowest chunk rather than
+    the sum of all of them. The audio is saved to the configured output
+    directory.
 
     Args:
         text: The script text to convert to speech
@@ -58,26 +102,174 @@ async def generate_audio(
     # Use provided voice or fall back to config
     voice = voice_id or settings.elevenlabs_voice_id
 
-    # Ensure output directory exists
-    output_dir = Path(settings.audio_output_dir)
-    output_dir.mkdir(parents=True, exist_ok=True)
+    output_path = _OUTPUT_DIR / output_filename
+
+    chunks = _split_script(text)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_TTS_REQUESTS)
+
+    async def synthesize(index: int) -> bytes:
+        async with semaphore:
+            return await _synthesize_chunk(
+                chunks[index],
+                voice,
+                previous_text=chunks[index - 1] if index > 0 else None,
+                next_text=chunks[index + 1] if index + 1 < len(chunks) else None,
+            )
+
+    # gather preserves order, so the MP3 segments line up with the script
+    segments = await asyncio.gather(*(synthesize(i) for i in range(len(chunks))))
+
+    async with aiofiles.open(output_path, "wb") as f:
+        await f.write(b"".join(segments))
+
+    return output_path
+
+
+async def generate_audio_stream(
+    sentences: AsyncIterable[str],
+    output_filename: str,
+    voice_id: str | None = None,
+) -> Path:
+    """Convert a stream of sentences to speech and save as MP3.
+
+    Sentences are packed into chunks of up to MAX_CHUNK_CHARS; each chunk
+    is sent to ElevenLabs as soon as it is full, so synthesis overlaps with
+    script generation instead of waiting for the whole script. If a chunk
+    fails (e.g. a bad API key or exhausted quota), its error is raised as
+    soon as the next sentence arrives, instead of after the whole script
+    has been generated and every other chunk dispatched.
+
+    Args:
+        sentences: Script sentences, in order (e.g. stream_script_sentences())
+        output_filename: Name for the output file (e.g., "episode_001.mp3")
+        voice_id: ElevenLabs voice ID. Defaults to settings.elevenlabs_voice_id
+
+    Returns:
+        Path to the saved audio file
+
+    Raises:
+        elevenlabs.ApiError: If the ElevenLabs API call fails
+        OSError: If file cannot be written
+    """
+    voice = voice_id or settings.elevenlabs_voice_id
+    output_path = _OUTPUT_DIR / output_filename
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_TTS_REQUESTS)
+    tasks: list[asyncio.Task[bytes]] = []
+    previous_chunk: str | None = None
+
+    async def synthesize(chunk: str, previous_text: str | None) -> bytes:
+        async with semaphore:
+            return await _synthesize_chunk(chunk, voice, previous_text=previous_text)
+
+    def raise_if_failed() -> None:
+        for task in tasks:
+            if task.done() and task.exception() is not None:
+                raise task.exception()
+
+    def dispatch(chunk: str) -> None:
+        # next_text is unknown while the script is still being written,
+        # so only the preceding chunk is passed for prosody context
+        nonlocal previous_chunk
+        chunk = chunk.strip()
+        if chunk:
+            tasks.append(asyncio.create_task(synthesize(chunk, previous_chunk)))
+            previous_chunk = chunk
+
+    try:
+        current = ""
+        async for sentence in sentences:
+            raise_if_failed()
+            if len(current) + len(sentence) <= MAX_CHUNK_CHARS:
+                current += sentence
+            elif len(sentence) <= MAX_CHUNK_CHARS:
+                dispatch(current)
+                current = sentence
+            else:
+                # A single oversized sentence: split it on whitespace
+                dispatch(current)
+                current = ""
+                for piece in _split_script(sentence):
+                    dispatch(piece)
+        dispatch(current)
 
-    output_path = output_dir / output_filename
+        # Tasks were created in script order, so segments line up
+        segments = await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
 
-    # Initialize ElevenLabs client
-    client = ElevenLabs(api_key=settings.elevenlabs_api_key)
+    async with aiofiles.open(output_path, "wb") as f:
+        await f.write(b"".join(segments))
 
-    # Generate audio using text-to-speech
-    # Returns a generator of audio chunks
-    audio_generator = client.text_to_speech.convert(
-        voice_id=voice,
+    return output_path
+
+
+async def _synthesize_chunk(
+    text: str,
+    voice_id: str,
+    previous_text: str | None = None,
+    next_text: str | None = None,
+) -> bytes:
+    """Synthesize one chunk of text and return its MP3 bytes."""
+    audio_stream = _get_client().text_to_speech.convert(
+        voice_id=voice_id,
         text=text,
-        model_id="eleven_multilingual_v2",  # High quality multilingual model
+        model_id=MODEL_ID,
+        previous_text=previous_text,
+        next_text=next_text,
     )
+    return b"".join([chunk async for chunk in audio_stream])
 
-    # Write audio chunks to file
-    with open(output_path, "wb") as f:
-        for chunk in audio_generator:
-            f.write(chunk)
 
-    return output_path
+def _split_script(text: str, max_chars: int = MAX_CHUNK_CHARS) -> list[str]:
+    """Split a script into chunks of at most max_chars characters.
+
+    Chunks are packed from whole paragraphs where possible, falling back
+    to whole sentences for long paragraphs, so no sentence is cut in
+    half. A single sentence longer than max_chars is split on whitespace.
+
+    Args:
+        text: The full script
+        max_chars: Maximum characters per chunk
+
+    Returns:
+        List of non-empty chunks, in script order
+    """
+    # Break the script into (separator, piece) pairs that each fit in one
+    # chunk. Sentences of a split paragraph are rejoined with a space.
+    pieces = []
+    for paragraph in text.split("\n\n"):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        if len(paragraph) <= max_chars:
+            pieces.append(("\n\n", paragraph))
+            continue
+        separator = "\n\n"
+        for sentence in SENTENCE_END.split(paragraph):
+            while len(sentence) > max_chars:
+                cut = sentence.rfind(" ", 0, max_chars)
+                cut = cut if cut > 0 else max_chars
+                pieces.append((separator, sentence[:cut]))
+                sentence = sentence[cut:].lstrip()
+                separator = " "
+            if sentence:
+                pieces.append((separator, sentence))
+                separator = " "
+
+    # Greedily pack pieces into chunks
+    chunks = []
+    current = ""
+    for separator, piece in pieces:
+        candidate = f"{current}{separator}{piece}" if current else piece
+        if len(candidate) <= max_chars:
+            current = candidate
+        else:
+            chunks.append(current)
+            current = piece
+    if current:
+        chunks.append(current)
+
+    return chunks
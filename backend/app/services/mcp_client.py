@@ -12,6 +12,11 @@ How MCP Works:
 Architecture:
     - ArxivMCPClient: Manages connection to the arXiv MCP server
     - Uses AsyncExitStack for proper resource cleanup
+    - Safe to share: connect() is idempotent and guarded by a lock, and the
+      MCP session multiplexes concurrent tool calls over one connection
+    - acquire_mcp()/close_mcp(): one shared client per process, so the
+      server subprocess is started once rather than per generation (and
+      restarted if it dies)
     - Exposes tools: search_papers, download_paper, list_papers, read_paper
 
 Usage:
@@ -25,19 +30,58 @@ Usage:
         # Read the downloaded paper
         content = await client.call_tool("read_paper", {"paper_id": "2401.12345"})
 
+        # Run several independent calls concurrently
+        contents = await client.call_tools_batch([
+            ("read_paper", {"paper_id": "2401.12345"}),
+            ("read_paper", {"paper_id": "2401.67890"}),
+        ])
+
+    # Or borrow the process-wide shared client (started on first use)
+    async with acquire_mcp() as client:
+        results = await client.call_tool("search_papers", {"query": "transformers"})
+    await close_mcp()  # On process shutdown
+
 Dependencies:
     - mcp: Official MCP Python SDK
     - arxiv-mcp-server: The arXiv MCP server package (installed as a tool)
 """
 
-from contextlib import AsyncExitStack
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from contextlib import AsyncExitStack, asynccontextmanager
 from pathlib import Path
 from typing import Any
 
+import orjson
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
+from mcp.types import CallToolResult
 
 from app.core.config import settings
+from app.core.retry import retry_on_timeout
+from app.services.research.rate_limit import arxiv_rate_limit
+
+
+class MCPTimeoutError(Exception):
+    """Raised when an MCP tool call still times out after all retries."""
+
+
+class MCPToolError(Exception):
+    """Raised when an MCP tool reports a failure (the message is its output)."""
+
+
+logger = logging.getLogger(__name__)
+
+# Tools that make the server call arXiv; these share the arXiv rate limit
+# (list_papers/read_paper only touch local storage)
+ARXIV_NETWORK_TOOLS = {"search_papers", "download_paper"}
+
+# Maximum tool calls in flight at once in call_tools_batch
+MAX_CONCURRENT_TOOL_CALLS = 8
+
+# Seconds an idle server gets to answer a ping before it is considered hung
+PING_TIMEOUT_S = 5
 
 
 class ArxivMCPClient:
@@ -54,7 +98,7 @@ class ArxivMCPClient:
 
     Example:
         async with ArxivMCPClient() as client:
-            tools = await client.list_tools()
+            tools = await client.list_tools()  # Fetched once, then cached
             result = await client.call_tool("search_papers", {"query": "LLMs"})
     """
 
@@ -67,8 +111,12 @@ class ArxivMCPClient:
         """
         self.storage_path = storage_path or str(Path("papers").absolute())
         self.session: ClientSession | None = None
+        # Transport stream the server's stdout is read into; loses its
+        # sender when the server process exits
+        self._read_stream: Any = None
         self.exit_stack = AsyncExitStack()
         self._tools: list[dict] = []
+        self._connect_lock = asyncio.Lock()
 
     async def __aenter__(self) -> "ArxivMCPClient":
         """Connect to the MCP server when entering async context."""
@@ -85,9 +133,21 @@ class ArxivMCPClient:
         This starts the arxiv-mcp-server as a subprocess using `uv tool run`.
         The server communicates via stdio (stdin/stdout).
 
-        After connecting, we call initialize() to complete the MCP handshake
-        and discover available tools.
+        After connecting, we call initialize() to complete the MCP handshake.
+        Tools are discovered lazily by list_tools() on first use.
+
+        Calling this on an already-connected client is a no-op, so a shared
+        client can be connected from several places without spawning
+        duplicate server processes.
         """
+        async with self._connect_lock:
+            if self.session:
+                return
+
+            await self._connect()
+
+    async def _connect(self):
+        """Start the server subprocess and run the MCP handshake."""
         # Server parameters for stdio transport
         # Using `uv tool run` to run the installed arxiv-mcp-server
         server_params = StdioServerParameters(
@@ -104,6 +164,7 @@ class ArxivMCPClient:
             stdio_client(server_params)
         )
         stdio, write = stdio_transport
+        self._read_stream = stdio
 
         # Create client session for JSON-RPC communication
         self.session = await self.exit_stack.enter_async_context(
@@ -113,37 +174,70 @@ class ArxivMCPClient:
         # Initialize the connection (MCP handshake)
         await self.session.initialize()
 
-        # Discover available tools
-        response = await self.session.list_tools()
-        self._tools = [
-            {
-                "name": tool.name,
-                "description": tool.description,
-                "input_schema": tool.inputSchema
-            }
-            for tool in response.tools
-        ]
-
-        print(f"  🔌 Connected to arXiv MCP server")
-        print(f"     Available tools: {[t['name'] for t in self._tools]}")
+        logger.debug("Connected to arXiv MCP server")
 
     async def cleanup(self):
         """Clean up resources and close the connection."""
         await self.exit_stack.aclose()
         self.session = None
+        self._read_stream = None
+        self._tools = []
+
+    @property
+    def is_connected(self) -> bool:
+        """Whether the session is open and the server process is still running.
+
+        Checked without a round-trip: when the server subprocess exits, the
+        transport stops reading its stdout and closes the session's read
+        stream, leaving it with no open sender.
+        """
+        return (
+            self.session is not None
+            and self._read_stream is not None
+            and self._read_stream.statistics().open_send_streams > 0
+        )
+
+    async def is_alive(self) -> bool:
+        """Check that the server still answers, with an MCP ping.
+
+        Unlike is_connected, this also catches a server that is running
+        but hung. A busy server (e.g. converting a downloaded PDF) can miss
+        the ping too, so only ping a server nobody is using.
+
+        Returns:
+            False if not connected, or if the ping fails or times out
+        """
+        if not self.session:
+            return False
+
+        try:
+            async with asyncio.timeout(PING_TIMEOUT_S):
+                await self.session.send_ping()
+        except Exception:
+            return False
+        return True
 
     @property
     def tools(self) -> list[dict]:
-        """Get the list of available tools from the server.
+        """Get the cached list of tools from the server.
 
         Returns:
             List of tool definitions with name, description, and input_schema.
             Format matches what Claude expects for tool use.
+
+        Raises:
+            RuntimeError: If tools haven't been fetched yet (await list_tools() first)
         """
+        if not self._tools:
+            raise RuntimeError("Tools not loaded yet. Await list_tools() first.")
+
         return self._tools
 
     async def list_tools(self) -> list[dict]:
-        """Fetch and return available tools from the server.
+        """Return available tools, fetching them from the server on first call.
+
+        The server's tool set doesn't change during a connection, so the
+        result is cached and later calls cost no RPC.
 
         Returns:
             List of tool definitions
@@ -151,19 +245,29 @@ class ArxivMCPClient:
         if not self.session:
             raise RuntimeError("Not connected to MCP server. Call connect() first.")
 
-        response = await self.session.list_tools()
-        return [
-            {
-                "name": tool.name,
-                "description": tool.description,
-                "input_schema": tool.inputSchema
-            }
-            for tool in response.tools
-        ]
+        if not self._tools:
+            response = await self.session.list_tools()
+            self._tools = [
+                {
+                    "name": tool.name,
+                    "description": tool.description,
+                    "input_schema": tool.inputSchema
+                }
+                for tool in response.tools
+            ]
+            logger.debug("Available MCP tools: %s", [t["name"] for t in self._tools])
+
+        return self._tools
 
     async def call_tool(self, tool_name: str, arguments: dict[str, Any]) -> str:
         """Call a tool on the MCP server.
 
+        Each attempt is bounded by settings.mcp_timeout_s, and timed-out
+        calls are retried with exponential backoff, so a stuck server
+        can't hold the caller forever. Each attempt of a tool that hits
+        arXiv first waits for the shared arXiv rate limit (not counted
+        against the timeout).
+
         Args:
             tool_name: Name of the tool to call (e.g., "search_papers")
             arguments: Tool arguments as a dictionary
@@ -173,20 +277,234 @@ class ArxivMCPClient:
 
         Raises:
             RuntimeError: If not connected to the server
+            MCPTimeoutError: If the call times out on every attempt
+            MCPToolError: If the tool reports a failure (e.g. arXiv
+                          unreachable or rate limiting), so callers don't
+                          mistake the error text for a result
         """
         if not self.session:
             raise RuntimeError("Not connected to MCP server. Call connect() first.")
 
-        result = await self.session.call_tool(tool_name, arguments)
+        try:
+            result = await self._call_with_retry(tool_name, arguments)
+        except TimeoutError:
+            raise MCPTimeoutError(
+                f"MCP tool '{tool_name}' timed out after {settings.mcp_timeout_s}s "
+                f"({settings.timeout_max_retries + 1} attempts)"
+            ) from None
 
         # Extract text content from result
         # MCP returns content as a list of content blocks
-        if result.content:
-            # Concatenate all text content
-            texts = []
-            for block in result.content:
-                if hasattr(block, "text"):
-                    texts.append(block.text)
-            return "\n".join(texts) if texts else str(result.content)
-
-        return "No result returned"
+        if not result.content:
+            if result.isError:
+                raise MCPToolError(f"MCP tool '{tool_name}' failed")
+            return "No result returned"
+
+        # Concatenate all text content in a single join (filtered on the
+        # block type; images and embedded resources have no text)
+        texts = [block.text for block in result.content if block.type == "text"]
+        text = "\n".join(texts) if texts else str(result.content)
+
+        if result.isError or _is_error_text(text):
+            raise MCPToolError(text)
+        return text
+
+    async def _call_with_retry(
+        self, tool_name: str, arguments: dict[str, Any]
+    ) -> CallToolResult:
+        """Call a tool with the configured timeout and retries.
+
+        arXiv tools take a slot in the shared arXiv rate limit per attempt,
+        so the slot is released while backing off between retries.
+        """
+        return await retry_on_timeout(
+            lambda: self.session.call_tool(tool_name, arguments),
+            timeout_s=settings.mcp_timeout_s,
+            max_retries=settings.timeout_max_retries,
+            slot=arxiv_rate_limit if tool_name in ARXIV_NETWORK_TOOLS else None,
+        )
+
+    async def call_tools_batch(
+        self, calls: list[tuple[str, dict[str, Any]]]
+    ) -> list[str | MCPTimeoutError | MCPToolError]:
+        """Call several tools concurrently.
+
+        The MCP session multiplexes requests over one stdio connection, so
+        independent calls (e.g., downloading or reading several papers) can
+        be in flight together: total time is roughly the slowest call
+        rather than the sum. At most MAX_CONCURRENT_TOOL_CALLS run at once.
+
+        A call that times out or fails doesn't fail the batch: its
+        MCPTimeoutError/MCPToolError is returned in place of its result,
+        while the other calls finish normally. Any other error (e.g. the
+        server crashed mid-batch) cancels the remaining calls and is raised
+        as is, not wrapped in an ExceptionGroup.
+
+        Note: MCP doesn't support JSON-RPC batch requests (removed from the
+        spec), so each call is still its own request.
+
+        Args:
+            calls: (tool_name, arguments) pairs
+
+        Returns:
+            Tool results as strings (or the MCPTimeoutError/MCPToolError
+            of calls that failed), in the same order as `calls`
+
+        Raises:
+            RuntimeError: If not connected to the server
+            Exception: The first unexpected error from a call
+        """
+        if not self.session:
+            raise RuntimeError("Not connected to MCP server. Call connect() first.")
+
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_TOOL_CALLS)
+
+        async def call(
+            tool_name: str, arguments: dict[str, Any]
+        ) -> str | MCPTimeoutError | MCPToolError:
+            async with semaphore:
+                try:
+                    return await self.call_tool(tool_name, arguments)
+                except (MCPTimeoutError, MCPToolError) as e:
+                    logger.warning("%s", e)
+                    return e
+
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(call(name, args)) for name, args in calls]
+        except ExceptionGroup as group:
+            # Surface the failure itself: callers (and the SSE/Celery error
+            # messages) expect e.g. McpError, not "unhandled errors in a
+            # TaskGroup"
+            raise group.exceptions[0] from None
+
+        return [task.result() for task in tasks]
+
+
+def _is_error_text(text: str) -> bool:
+    """Tell whether a tool's text output reports a failure.
+
+    Older arxiv-mcp-server versions don't set isError: failures come back
+    as "Error: ..." text, and newer ones still return arXiv rate limiting
+    as a {"status": "rate_limited", ...} payload.
+    """
+    if text.startswith("Error:"):
+        return True
+    if not text.startswith("{"):
+        return False
+    try:
+        payload = orjson.loads(text)
+    except orjson.JSONDecodeError:
+        return False
+    return isinstance(payload, dict) and payload.get("status") in ("error", "rate_limited")
+
+
+# The process-wide client behind acquire_mcp(). It is owned by a background
+# task because the MCP stdio transport must be closed by the same task that
+# opened it, while the callers (requests, Celery tasks) each run in their own.
+_shared_task: asyncio.Task | None = None
+_shared_client: asyncio.Future[ArxivMCPClient] | None = None
+_shared_stop: asyncio.Event | None = None
+
+# Serializes the check-and-restart in acquire_mcp(), so concurrent
+# borrowers never start two servers
+_shared_lock = asyncio.Lock()
+
+# Number of acquire_mcp() blocks currently using the shared client
+_borrowers = 0
+
+# Seconds the owner task gets to shut the server down before it is cancelled
+_CLOSE_TIMEOUT_S = 10
+
+
+async def _run_shared_client(
+    started: asyncio.Future[ArxivMCPClient], stop: asyncio.Event
+) -> None:
+    """Connect the shared client and keep it open until stop is set."""
+    try:
+        async with ArxivMCPClient() as client:
+            # Load tools now (one RPC) so the first generation finds them cached
+            await client.list_tools()
+            started.set_result(client)
+            await stop.wait()
+    except BaseException as e:
+        if not started.done():
+            started.set_exception(e)
+        raise
+
+
+@asynccontextmanager
+async def acquire_mcp() -> AsyncIterator[ArxivMCPClient]:
+    """Borrow the process-wide arXiv MCP client, starting it on first use.
+
+    Starting the server subprocess and running the MCP handshake takes
+    0.5-2s, so it is done once per process and the connection is reused
+    by every generation. The client isn't exclusive to the borrower: the
+    MCP session multiplexes concurrent tool calls.
+
+    A new server is started if the current one failed to start, was
+    closed, or its subprocess exited. A server that is running but might
+    be hung is only pinged (and restarted if it doesn't answer) while
+    nothing has it borrowed: a server busy with another generation's
+    calls can be slow to answer, and restarting it would fail those
+    calls. Borrowers of a server in use don't wait for a ping.
+
+    Yields:
+        The shared, connected client (with its tools already loaded)
+    """
+    global _borrowers
+
+    async with _shared_lock:
+        client = await _get_shared_client()
+        _borrowers += 1
+    try:
+        yield client
+    finally:
+        _borrowers -= 1
+
+
+async def _get_shared_client() -> ArxivMCPClient:
+    """Return the shared client, (re)starting the server if needed."""
+    global _shared_task, _shared_client, _shared_stop
+
+    # Started and running: check the server is still there
+    if _shared_task is not None and not _shared_task.done() and _shared_client.done():
+        client = _shared_client.result()
+        if not client.is_connected:
+            logger.warning("Shared arXiv MCP server has exited; restarting it")
+            await close_mcp()
+        elif _borrowers or await client.is_alive():
+            return client
+        else:
+            logger.warning("Idle shared arXiv MCP server is not responding; restarting it")
+            await close_mcp()
+
+    if _shared_task is None or _shared_task.done():
+        _shared_client = asyncio.get_running_loop().create_future()
+        _shared_stop = asyncio.Event()
+        _shared_task = asyncio.create_task(_run_shared_client(_shared_client, _shared_stop))
+
+    # Shielded: a cancelled borrower must not cancel the startup for the others
+    return await asyncio.shield(_shared_client)
+
+
+async def close_mcp() -> None:
+    """Stop the shared MCP server, if one was started.
+
+    Call on process shutdown (app lifespan, Celery worker shutdown, end of
+    a CLI run). Startup errors were already raised to the borrowers, so
+    they are not raised again here.
+    """
+    global _shared_task
+
+    if _shared_task is None:
+        return
+
+    task, _shared_task = _shared_task, None
+    _shared_stop.set()
+
+    # A dead server can hang its own shutdown; don't let it hang ours
+    done, _ = await asyncio.wait({task}, timeout=_CLOSE_TIMEOUT_S)
+    if not done:
+        task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
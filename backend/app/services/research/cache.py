@@ -0,0 +1,88 @@
+"""Research Result Cache
+
+Redis-backed cache for research source results, so repeated searches
+(re-generating a topic, development runs) skip the network entirely.
+
+Usage:
+    from app.services.research.cache import get_cached_items, set_cached_items
+
+    items = await get_cached_items("arxiv:transformers:5")
+    if items is None:
+        items = await fetch_from_api(...)
+        await set_cached_items("arxiv:transformers:5", items)
+
+Notes:
+    - Items are stored as JSON via orjson, which serializes the
+      ResearchItem dataclasses natively (no asdict() copies)
+    - Entries expire after settings.research_cache_ttl_s seconds
+    - The cache is best-effort: if Redis is unavailable, lookups miss
+      and writes are skipped instead of failing the search
+    - Covers ArxivSource searches only (RESEARCH_CACHE_*, 1h by default).
+      Searches made through the MCP server during podcast generation are
+      cached on disk by research/search_cache.py instead (SEARCH_CACHE_*)
+"""
+
+import orjson
+import redis.asyncio as redis
+
+from app.core.config import settings
+from app.services.research.sources.base import ResearchItem
+
+
+_redis: redis.Redis | None = None
+
+
+def _get_redis() -> redis.Redis:
+    """Return the shared Redis client, creating it on first use."""
+    global _redis
+    if _redis is None:
+        _redis = redis.from_url(settings.redis_url)
+    return _redis
+
+
+async def get_cached_items(key: str) -> list[ResearchItem] | None:
+    """Look up cached research items.
+
+    Args:
+        key: Cache key (e.g., "arxiv:transformers:5")
+
+    Returns:
+        The cached items, or None on a miss (or if Redis is unavailable)
+    """
+    if not settings.research_cache_enabled:
+        return None
+
+    try:
+        cached = await _get_redis().get(key)
+    except redis.RedisError:
+        return None
+
+    if cached is None:
+        return None
+
+    return [ResearchItem(**item) for item in orjson.loads(cached)]
+
+
+async def set_cached_items(key: str, items: list[ResearchItem]) -> None:
+    """Store research items in the cache with the configured TTL.
+
+    Args:
+        key: Cache key (e.g., "arxiv:transformers:5")
+        items: Items to cache
+    """
+    if not settings.research_cache_enabled:
+        return
+
+    payload = orjson.dumps(items)
+    try:
+        await _get_redis().set(key, payload, ex=settings.research_cache_ttl_s)
+    except redis.RedisError:
+        pass
+
+
+async def close_cache() -> None:
+    """Close the shared Redis client (call on app shutdown)."""
+    global _redis
+    if _redis is not None:
+        await _redis.aclose()
+        _redis = None
@@ -0,0 +1,118 @@
+"""arXiv Rate Limiting
+
+arXiv asks API clients to make no more than one request every three
+seconds over a single connection; bursts get throttled, which then
+cascades into retries. Every code path that hits arXiv (the ArxivSource
+HTTP client and the arXiv MCP server's network tools) goes through the
+budget defined here. A slot is held for a single request attempt;
+callers apply their own timeouts only after acquiring it, so queueing
+for the budget never counts as a timeout.
+
+The request rate is enforced in Redis (settings.redis_url), so it is
+shared by every process: the API, each Celery worker process (generation
+runs one task per prefork process) and the CLI. Each request reserves
+the next free send time with an atomic script, spacing requests
+arxiv_rate_limit_period_s / arxiv_rate_limit_requests seconds apart.
+
+Usage:
+    from app.services.research.rate_limit import arxiv_rate_limit
+
+    async with arxiv_rate_limit():
+        response = await client.get(...)
+
+    await close_rate_limit()  # On process shutdown
+
+Notes:
+    - The in-flight cap (arxiv_max_concurrent_requests) is per process
+    - If Redis is unavailable, the rate falls back to a per-process
+      token bucket, so arXiv is still throttled (just not globally)
+
+Dependencies:
+    - redis: Shared request schedule across processes
+    - aiolimiter: Async token-bucket (leaky bucket) rate limiter (fallback)
+    - app.core.config: For the Redis URL and the rate and concurrency settings
+"""
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import redis.asyncio as redis
+from aiolimiter import AsyncLimiter
+
+from app.core.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+# Redis key holding the earliest time (Redis server clock, seconds) the
+# next arXiv request may be sent
+_NEXT_SLOT_KEY = "arxiv:rate_limit:next_slot"
+
+# Reserves the next free send time and returns how long to wait for it.
+# Uses the Redis server clock so processes on different hosts agree, and
+# returns strings because Lua numbers are truncated to integers in replies.
+_RESERVE_SLOT_SCRIPT = """
+local now = redis.call('TIME')
+local now_s = tonumber(now[1]) + tonumber(now[2]) / 1000000
+local slot = math.max(now_s, tonumber(redis.call('GET', KEYS[1]) or '0'))
+local next_slot = slot + tonumber(ARGV[1])
+redis.call('SET', KEYS[1], tostring(next_slot),
+           'PX', math.ceil((next_slot - now_s) * 1000) + 1000)
+return tostring(slot - now_s)
+"""
+
+# Seconds between two requests across all processes
+_INTERVAL_S = settings.arxiv_rate_limit_period_s / settings.arxiv_rate_limit_requests
+
+# Token bucket used instead when Redis is unavailable: at most
+# arxiv_rate_limit_requests per arxiv_rate_limit_period_s in this process
+_limiter = AsyncLimiter(
+    max_rate=settings.arxiv_rate_limit_requests,
+    time_period=settings.arxiv_rate_limit_period_s,
+)
+
+# Caps requests in flight at once (arXiv asks for a single connection)
+_semaphore = asyncio.Semaphore(settings.arxiv_max_concurrent_requests)
+
+_redis: redis.Redis | None = None
+
+
+def _get_redis() -> redis.Redis:
+    """Return the Redis client for the shared schedule, creating it on first use."""
+    global _redis
+    if _redis is None:
+        _redis = redis.from_url(settings.redis_url)
+    return _redis
+
+
+async def _wait_for_slot() -> None:
+    """Wait until this process may send its next arXiv request."""
+    try:
+        wait_s = float(
+            await _get_redis().eval(_RESERVE_SLOT_SCRIPT, 1, _NEXT_SLOT_KEY, _INTERVAL_S)
+        )
+    except redis.RedisError as e:
+        logger.warning("Shared arXiv rate limit unavailable, limiting per process: %s", e)
+        await _limiter.acquire()
+        return
+
+    if wait_s > 0:
+        await asyncio.sleep(wait_s)
+
+
+@asynccontextmanager
+async def arxiv_rate_limit() -> AsyncIterator[None]:
+    """Wait for a slot in the shared arXiv request budget."""
+    async with _semaphore:
+        await _wait_for_slot()
+        yield
+
+
+async def close_rate_limit() -> None:
+    """Close the Redis client (call on process shutdown)."""
+    global _redis
+    if _redis is not None:
+        await _redis.aclose()
+        _redis = None
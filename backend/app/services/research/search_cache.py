@@ -0,0 +1,99 @@
+"""Search Result Cache (on disk)
+
+Persistent cache for arXiv search results returned by the MCP server's
+`search_papers` tool. Popular topics get the same searches over and over
+across generations; serving them from disk skips the arXiv round-trip
+and eases pressure on arXiv's rate limits.
+
+Usage:
+    from app.services.research.search_cache import SearchCache
+
+    cache = SearchCache("cache/search_cache.sqlite3", ttl_s=86400)
+    key = SearchCache.make_key("search_papers", {"query": "transformers"})
+
+    result = await cache.get(key)
+    if result is None:
+        result = await mcp.call_tool("search_papers", {"query": "transformers"})
+        await cache.set(key, result)
+
+Notes:
+    - Backed by stdlib sqlite3; every operation runs in a worker thread
+      (asyncio.to_thread) so disk I/O never blocks the event loop
+    - Entries expire after ttl_s seconds (arXiv listings change slowly)
+    - Survives restarts and is shared by the API and CLI on the same machine
+    - This is the cache on the podcast generation path (SEARCH_CACHE_*,
+      24h by default; the CLI's --no-cache bypasses it). ArxivSource
+      searches have their own Redis cache in research/cache.py
+      (RESEARCH_CACHE_*, 1h), which --no-cache doesn't affect
+"""
+
+import asyncio
+import hashlib
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+
+class SearchCache:
+    """SQLite-backed key/value cache with a time-to-live."""
+
+    def __init__(self, path: str | Path, ttl_s: int):
+        """Initialize the cache.
+
+        Args:
+            path: SQLite database file (created on first write)
+            ttl_s: Seconds before an entry expires
+        """
+        self.path = Path(path)
+        self.ttl_s = ttl_s
+        self._initialized = False
+
+    @staticmethod
+    def make_key(tool_name: str, arguments: dict[str, Any]) -> str:
+        """Build a cache key from a tool name and its arguments.
+
+        All arguments are part of the key (not just the query), so searches
+        that differ only in e.g. max_results or categories don't collide.
+        """
+        canonical = orjson.dumps(arguments, option=orjson.OPT_SORT_KEYS)
+        return hashlib.sha1(tool_name.encode() + b"|" + canonical).hexdigest()
+
+    async def get(self, key: str) -> str | None:
+        """Return the cached value for key, or None if missing or expired."""
+        return await asyncio.to_thread(self._get, key)
+
+    async def set(self, key: str, value: str) -> None:
+        """Store value under key, replacing any previous entry."""
+        await asyncio.to_thread(self._set, key, value)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection, creating the database and table on first use."""
+        if not self._initialized:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path)
+        if not self._initialized:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS search_cache "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+            self._initialized = True
+        return conn
+
+    def _get(self, key: str) -> str | None:
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT value FROM search_cache WHERE key = ? AND created_at > ?",
+                (key, time.time() - self.ttl_s),
+            ).fetchone()
+        return row[0] if row else None
+
+    def _set(self, key: str, value: str) -> None:
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO search_cache (key, value, created_at) VALUES (?, ?, ?)",
+                (key, value, time.time()),
+            )
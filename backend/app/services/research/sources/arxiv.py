@@ -1,10 +1,50 @@
-import xml.etree.ElementTree as ET
+import asyncio
 
 import httpx
+from lxml import etree
+
+from app.services.research.cache import get_cached_items, set_cached_items
+from app.services.research.rate_limit import arxiv_rate_limit
 
 from .base import ResearchItem, ResearchSource
 
 
+# Atom element tags in Clark notation ({namespace}tag), resolved once here
+# instead of expanding an "atom:" prefix on every find() call
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_ENTRY = f"{_ATOM}entry"
+_TITLE = f"{_ATOM}title"
+_SUMMARY = f"{_ATOM}summary"
+_ID = f"{_ATOM}id"
+_PUBLISHED = f"{_ATOM}published"
+_AUTHOR = f"{_ATOM}author"
+_NAME = f"{_ATOM}name"
+
+# Shared HTTP client: reuses keepalive connections to export.arxiv.org across
+# searches instead of paying a TCP+TLS handshake per query
+_client: httpx.AsyncClient | None = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the shared arXiv HTTP client, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            timeout=httpx.Timeout(10.0),
+        )
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared arXiv HTTP client (call on app shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
 class ArxivSource(ResearchSource):
     """Research source that fetches papers from arXiv API.
 
@@ -16,26 +56,33 @@ class ArxivSource(ResearchSource):
 
     BASE_URL = "https://export.arxiv.org/api/query"
 
-    # XML namespaces used in arXiv's Atom feed
-    NAMESPACES = {
-        "atom": "http://www.w3.org/2005/Atom",
-        "arxiv": "http://arxiv.org/schemas/atom",
-    }
-
     @property
     def source_type(self) -> str:
         return "arxiv"
 
-    async def search(self, query: str, max_results: int = 5) -> list[ResearchItem]:
+    async def search(
+        self, query: str, max_results: int = 5, timeout: float | None = None
+    ) -> list[ResearchItem]:
         """Search arXiv for papers matching the query.
 
+        Results are cached in Redis per (query, max_results), so repeat
+        searches don't hit the arXiv API until the cache entry expires.
+        Cache misses wait for the shared arXiv rate limit; `timeout` only
+        starts once a slot is acquired.
+
         Args:
             query: Search terms (searches title, abstract, authors)
             max_results: Maximum papers to return (default 5)
+            timeout: Seconds allowed for the arXiv request, or None
 
         Returns:
             List of ResearchItem objects with paper details
         """
+        cache_key = f"arxiv:{query}:{max_results}"
+        cached = await get_cached_items(cache_key)
+        if cached is not None:
+            return cached
+
         params = {
             "search_query": f"all:{query}",
             "start": 0,
@@ -44,28 +91,37 @@ class ArxivSource(ResearchSource):
             "sortOrder": "descending",
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(self.BASE_URL, params=params)
-            response.raise_for_status()
+        async with arxiv_rate_limit():
+            async with asyncio.timeout(timeout):
+                response = await get_client().get(self.BASE_URL, params=params)
+        response.raise_for_status()
 
-        return self._parse_response(response.text)
+        items = self._parse_response(response.content)
+        await set_cached_items(cache_key, items)
 
-    def _parse_response(self, xml_text: str) -> list[ResearchItem]:
-        """Parse arXiv Atom XML response into ResearchItem objects."""
-        root = ET.fromstring(xml_text)
+        return items
+
+    def _parse_response(self, xml_bytes: bytes) -> list[ResearchItem]:
+        """Parse arXiv Atom XML response into ResearchItem objects.
+
+        Uses lxml (libxml2) rather than ElementTree for faster parsing.
+        Takes raw bytes because lxml rejects str input that carries an
+        XML encoding declaration, which arXiv's feed does.
+        """
+        root = etree.fromstring(xml_bytes)
         items = []
 
-        for entry in root.findall("atom:entry", self.NAMESPACES):
-            title = entry.find("atom:title", self.NAMESPACES)
-            summary = entry.find("atom:summary", self.NAMESPACES)
-            link = entry.find("atom:id", self.NAMESPACES)
-            published = entry.find("atom:published", self.NAMESPACES)
+        for entry in root.iterfind(_ENTRY):
+            title = entry.find(_TITLE)
+            summary = entry.find(_SUMMARY)
+            link = entry.find(_ID)
+            published = entry.find(_PUBLISHED)
 
             # Get all authors
             authors = [
-                author.find("atom:name", self.NAMESPACES).text
-                for author in entry.findall("atom:author", self.NAMESPACES)
-                if author.find("atom:name", self.NAMESPACES) is not None
+                name.text
+                for author in entry.iterfind(_AUTHOR)
+                if (name := author.find(_NAME)) is not None
             ]
 
             items.append(
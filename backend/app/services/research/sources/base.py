@@ -1,7 +1,12 @@
+import asyncio
+import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 
 
+logger = logging.getLogger(__name__)
+
+
 @dataclass
 class ResearchItem:
     """A single piece of research content from any source."""
@@ -28,14 +33,69 @@ class ResearchSource(ABC):
         pass
 
     @abstractmethod
-    async def search(self, query: str, max_results: int = 5) -> list[ResearchItem]:
+    async def search(
+        self, query: str, max_results: int = 5, timeout: float | None = None
+    ) -> list[ResearchItem]:
         """Search this source for content matching the query.
 
         Args:
             query: Search terms (e.g., "machine learning transformers")
             max_results: Maximum number of results to return
+            timeout: Seconds allowed for the request itself, or None for
+                     no limit. Time spent waiting for a rate-limit slot
+                     isn't counted against it.
 
         Returns:
             List of ResearchItem objects
         """
         pass
+
+    async def search_many(
+        self,
+        queries: list[str],
+        max_results: int = 5,
+        concurrency: int = 5,
+        timeout: float = 15.0,
+    ) -> list[ResearchItem]:
+        """Run several searches concurrently and merge the results.
+
+        Queries run in parallel (at most `concurrency` at a time), so the
+        batch takes roughly as long as the slowest query rather than the
+        sum of all of them. A query that fails or exceeds `timeout`
+        seconds is logged and skipped instead of failing the whole batch.
+
+        Args:
+            queries: Search terms, one search per entry
+            max_results: Maximum number of results per query
+            concurrency: Maximum number of searches in flight at once
+            timeout: Per-query timeout in seconds (rate-limit waits excluded)
+
+        Returns:
+            ResearchItem objects from all queries, in query order,
+            deduplicated by URL
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(query: str) -> list[ResearchItem]:
+            async with semaphore:
+                return await self.search(query, max_results=max_results, timeout=timeout)
+
+        results = await asyncio.gather(
+            *(run(query) for query in queries),
+            return_exceptions=True,
+        )
+
+        items = []
+        seen_urls = set()
+        for query, result in zip(queries, results):
+            if isinstance(result, BaseException):
+                logger.warning(
+                    "%s search for %r skipped: %r", self.source_type, query, result
+                )
+                continue
+            for item in result:
+                if item.url not in seen_urls:
+                    seen_urls.add(item.url)
+                    items.append(item)
+
+        return items
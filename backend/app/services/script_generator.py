@@ -7,9 +7,11 @@ their full content using the arxiv-mcp-server.
 Flow:
     1. Connect to arxiv-mcp-server via MCP protocol
     2. Claude receives the server's tools (search_papers, download_paper, read_paper, etc.)
-    3. Claude decides what to search, which papers to download, and what to read
-    4. Claude synthesizes all research into a podcast script
-    5. Returns the final script text
+    3. Research phase (Haiku): Claude decides what to search, which papers to download,
+       and what to read, until it signals that its research is complete or
+       the research budget (MAX_ITERATIONS turns / MAX_TOTAL_INPUT_TOKENS) runs out
+    4. Writing phase (Sonnet): Claude writes the script without tools, streamed token by token
+    5. Yields the script text as it is produced (or returns it in one piece)
 
 MCP Tools Available:
     - search_papers: Search arXiv for papers (returns metadata)
@@ -18,22 +20,51 @@ MCP Tools Available:
     - list_papers: List all downloaded papers
 
 Usage:
-    from app.services.script_generator import generate_script
+    from app.services.script_generator import (
+        generate_script,
+        stream_script,
+        stream_script_sentences,
+    )
 
+    # Whole script at once
     script = await generate_script("machine learning", duration_minutes=5)
 
+    # Progress events + script deltas as they are generated
+    async for event in stream_script("machine learning", duration_minutes=5):
+        if event.type == "delta":
+            print(event.data, end="")
+
+    # Complete sentences as they are generated (e.g. to pipeline into TTS)
+    async for sentence in stream_script_sentences("machine learning"):
+        ...
+
 Key Concepts:
     - MCP (Model Context Protocol): Standard for connecting AI to external tools
     - The arxiv-mcp-server runs as a subprocess, communicating via stdio
     - Claude dynamically discovers and uses the server's tools
+    - Research and writing are separate turns, so only the script itself is
+      streamed (never Claude's "let me search for..." narration)
 """
 
+import logging
+import re
+from collections.abc import AsyncIterator
+from contextlib import AsyncExitStack
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Literal
+from weakref import WeakKeyDictionary
+
 import anthropic
+import httpx
 
 from app.core.config import settings
-from app.services.mcp_client import ArxivMCPClient
+from app.services.mcp_client import ArxivMCPClient, MCPTimeoutError, acquire_mcp
+from app.services.research.search_cache import SearchCache
 
 
+logger = logging.getLogger(__name__)
+
 # System prompt for the agentic script generator
 SYSTEM_PROMPT = """You are a podcast script writer with access to arXiv research tools.
 
@@ -47,7 +78,10 @@ Your workflow should be:
 1. Search for relevant papers on the topic
 2. Download 2-3 of the most interesting/relevant papers
 3. Read the downloaded papers to understand their content deeply
-4. Write an engaging podcast script synthesizing your research
+   When multiple independent searches, downloads or reads are needed, request
+   them in parallel in a single response.
+4. When your research is complete, stop using tools and reply with a short
+   note saying you are ready to write. You will then be asked for the script.
 
 Your scripts should:
 - Be conversational and engaging, as if explaining to a curious friend
@@ -57,14 +91,118 @@ Your scripts should:
 - NOT include speaker labels, timestamps, or production notes
 - Flow naturally as a monologue
 
-Target length: approximately {word_count} words.
+Target length: approximately {word_count} words."""
+
+# Sent once research is done to get the script on its own (streamed) turn
+WRITE_PROMPT = (
+    "Now write the full podcast script based on your research. "
+    "Output only the script text itself."
+)
+
+# Sent instead when the research budget runs out before Claude is done
+BUDGET_WRITE_PROMPT = "Your research budget is used up, so stop researching. " + WRITE_PROMPT
+
+# Result of tool calls Claude's code still makes after the budget ran out
+# (programmatic mode), so the code can finish without more research
+BUDGET_TOOL_RESULT = "Research budget used up; the tool was not called. Finish without it."
+
+# Appended to the system prompt when programmatic tool calling is enabled
+PROGRAMMATIC_TOOLS_PROMPT = """
+
+Call the research tools from Python using the code execution tool, not
+directly. Tool outputs returned to your code are NOT shown to you, so your
+code should extract what matters (key ideas, methods, results, numbers,
+memorable examples) and print only those concise notes. Batch related calls
+(e.g. download and read several papers) in a single script."""
+
+# Research turns are short tool-use decisions (what to search, which paper
+# to read next), so they run on the faster, cheaper Haiku; the script's
+# prose quality comes from the writing turn, which runs on Sonnet
+RESEARCH_MODEL = "claude-haiku-4-5"
+WRITING_MODEL = "claude-sonnet-4-20250514"
+
+# Programmatic tool calling: Claude writes code that calls the MCP tools in a
+# sandbox, and only what that code prints enters the conversation. Used for
+# both phases in that mode (Haiku doesn't support it, and the writing turn
+# has to continue the same code execution container).
+PROGRAMMATIC_TOOLS_MODEL = "claude-sonnet-4-5"
+PROGRAMMATIC_TOOLS_BETA = "advanced-tool-use-2025-11-20"
+CODE_EXECUTION_TOOL = {"type": "code_execution_20250825", "name": "code_execution"}
+
+# Sentence boundary: whitespace following ., ! or ? (also used by the audio
+# generator to split scripts, so TTS chunks break where sentences do)
+SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+# Prompt-caching marker: everything up to a marked block is cached server-side
+# and re-read at a fraction of the cost/latency on the next call
+_CACHE_CONTROL = {"type": "ephemeral"}
+
+# Research budget per generation: once either limit is reached, Claude is
+# made to write the script with what it has. Bounds the cost and latency
+# of a model that keeps calling tools.
+MAX_ITERATIONS = 12
+MAX_TOTAL_INPUT_TOKENS = 150_000
+
+# Tool results longer than this are shortened before entering the history:
+# every later turn re-sends the whole history, so one full paper from
+# read_paper would otherwise be paid for again on each remaining turn
+MAX_TOOL_RESULT_CHARS = 20_000
+SECTION_PREVIEW_CHARS = 500
+
+# Markdown heading line (read_paper returns papers as markdown)
+_HEADING = re.compile(r"^#{1,6} .+$", re.MULTILINE)
+
+# Tool result sent back to Claude when a call times out on every attempt,
+# so it can try something else instead of the whole generation failing
+TOOL_TIMEOUT_RESULT = "Tool timed out after {timeout_s}s; try a different paper_id or query"
+
+# Tools whose results are cached on disk across generations
+CACHED_TOOLS = {"search_papers"}
+
+search_cache = SearchCache(settings.search_cache_path, ttl_s=settings.search_cache_ttl_s)
+
+# Tool definitions as sent to Claude, built once per MCP client and then
+# passed as the same list on every turn of every generation
+_claude_tools: WeakKeyDictionary[ArxivMCPClient, list[dict]] = WeakKeyDictionary()
+
+
+@lru_cache(maxsize=1)
+def _get_client() -> anthropic.AsyncAnthropic:
+    """Return the process-wide Anthropic client.
+
+    One async client reuses its HTTP connection pool across generations
+    and never blocks the event loop while waiting on Claude. Behind a
+    cached factory (rather than built at import) so tests can override
+    it and settings are read when first needed.
+
+    The SDK is the only retry layer for Claude calls: it bounds each
+    attempt with the timeout below and retries timeouts, connection
+    errors, 429s and 5xx responses with backoff.
+    """
+    return anthropic.AsyncAnthropic(
+        api_key=settings.anthropic_api_key,
+        max_retries=settings.timeout_max_retries,
+        timeout=httpx.Timeout(settings.llm_timeout_s, connect=10.0),
+    )
+
 
-When you're ready to write the script, just write it directly (don't use any tools)."""
+class LLMTimeoutError(Exception):
+    """Raised when a Claude API call still times out after all retries."""
+
+
+@dataclass
+class ScriptEvent:
+    """A progress event emitted while a script is being generated."""
+
+    type: Literal["tool", "delta"]  # "tool": a research tool call, "delta": script text
+    data: str
 
 
 async def generate_script(
     topic: str,
     duration_minutes: int | None = None,
+    mcp: ArxivMCPClient | None = None,
+    use_cache: bool = True,
 ) -> str:
     """Generate a podcast script using Claude with MCP arXiv tools.
 
@@ -75,6 +213,11 @@ async def generate_script(
         topic: The main topic of the podcast (e.g., "machine learning")
         duration_minutes: Target duration in minutes. Defaults to
                          settings.podcast_duration_minutes if not provided.
+        mcp: Connected MCP client to use. If not provided, the process-wide
+             shared client is used (see mcp_client.acquire_mcp).
+        use_cache: Serve repeated arXiv searches from the on-disk cache.
+                   Pass False to force fresh searches (results are still
+                   written back to the cache).
 
     Returns:
         The generated podcast script as a string, ready for TTS.
@@ -82,77 +225,485 @@ async def generate_script(
     Raises:
         anthropic.APIError: If the Anthropic API call fails
     """
+    parts = [
+        event.data
+        async for event in stream_script(topic, duration_minutes, mcp, use_cache)
+        if event.type == "delta"
+    ]
+    return "".join(parts) or "Error: No script generated"
+
+
+async def stream_script_sentences(
+    topic: str,
+    duration_minutes: int | None = None,
+    mcp: ArxivMCPClient | None = None,
+    use_cache: bool = True,
+) -> AsyncIterator[str]:
+    """Generate a podcast script, yielding it one complete sentence at a time.
+
+    Lets callers start downstream work (e.g. TTS) on the opening sentences
+    while Claude is still writing the rest of the script. Each sentence
+    keeps all of its trailing whitespace (a boundary at the end of a delta
+    waits for the next one, which may continue the whitespace), so
+    "".join() of everything yielded is exactly the script.
+
+    Args: Same as stream_script()
+
+    Yields:
+        Script sentences, in order
+    """
+    buffer = ""
+    async for event in stream_script(topic, duration_minutes, mcp, use_cache):
+        if event.type != "delta":
+            continue
+
+        buffer += event.data
+        start = 0
+        for match in SENTENCE_END.finditer(buffer):
+            if match.end() == len(buffer):
+                break
+            yield buffer[start:match.end()]
+            start = match.end()
+        buffer = buffer[start:]
+
+    if buffer:
+        yield buffer
+
+
+async def stream_script(
+    topic: str,
+    duration_minutes: int | None = None,
+    mcp: ArxivMCPClient | None = None,
+    use_cache: bool = True,
+) -> AsyncIterator[ScriptEvent]:
+    """Generate a podcast script, yielding progress and text as it arrives.
+
+    Runs the agentic research loop (yielding a "tool" event per tool call),
+    then streams the writing turn (yielding "delta" events with script text).
+
+    Args:
+        topic: The main topic of the podcast (e.g., "machine learning")
+        duration_minutes: Target duration in minutes. Defaults to
+                         settings.podcast_duration_minutes if not provided.
+        mcp: Connected MCP client to use. If not provided, the process-wide
+             shared client is used (see mcp_client.acquire_mcp).
+        use_cache: Serve repeated arXiv searches from the on-disk cache.
+                   Pass False to force fresh searches (results are still
+                   written back to the cache).
+
+    Yields:
+        ScriptEvent objects; concatenating the "delta" data gives the script
+
+    Raises:
+        anthropic.APIError: If the Anthropic API call fails
+        LLMTimeoutError: If a research turn times out on every attempt
+    """
     duration = duration_minutes or settings.podcast_duration_minutes
     word_count = duration * 150
 
-    client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
+    async with AsyncExitStack() as stack:
+        # Borrow the process-wide arXiv MCP client, unless one was passed in
+        if mcp is None:
+            mcp = await stack.enter_async_context(acquire_mcp())
+
+        tools = await _get_claude_tools(mcp)
+        system_prompt = SYSTEM_PROMPT.format(duration_minutes=duration, word_count=word_count)
+
+        # Request options shared by every turn
+        programmatic = settings.programmatic_tool_calling
+        client = _get_client()
+        api = client.beta.messages if programmatic else client.messages
+        research_model, writing_model = RESEARCH_MODEL, WRITING_MODEL
+        request_options = {"max_tokens": 8000}
+        if programmatic:
+            system_prompt += PROGRAMMATIC_TOOLS_PROMPT
+            research_model = writing_model = PROGRAMMATIC_TOOLS_MODEL
+            request_options.update(betas=[PROGRAMMATIC_TOOLS_BETA])
 
-    # Connect to the arXiv MCP server
-    async with ArxivMCPClient() as mcp:
-        # Get available tools from the MCP server
-        tools = mcp.tools
+        system = [{"type": "text", "text": system_prompt, "cache_control": _CACHE_CONTROL}]
 
-        # Initial message asking Claude to research and write the script
+        # Initial message asking Claude to research the topic
         messages = [
             {
                 "role": "user",
-                "content": f'Research and create a podcast script about "{topic}". '
+                "content": f'Research "{topic}" for a podcast script. '
                 f"First search for relevant papers, download 2-3 of the most interesting ones, "
-                f"read them to understand the content deeply, then write an engaging "
+                f"and read them to understand the content deeply. The script will be an engaging "
                 f"{duration}-minute script (~{word_count} words) based on your research.",
             }
         ]
 
-        # Agentic loop: keep calling Claude until it gives us the final script
-        while True:
-            response = client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=8000,
-                system=SYSTEM_PROMPT.format(duration_minutes=duration, word_count=word_count),
+        # Rolling cache breakpoint on the newest tool result, so each turn
+        # re-reads the conversation so far from cache (the API allows at
+        # most 4 breakpoints, so the previous one is removed each turn).
+        # On Haiku this is the only breakpoint that takes effect: the
+        # system + tools prefix alone is below its minimum cacheable length.
+        history_breakpoint: dict | None = None
+
+        # Results of the tool calls made so far, so a repeated identical call
+        # is answered from memory instead of being executed again
+        seen_results: dict[str, str] = {}
+        input_tokens = 0
+
+        # Research phase: keep calling Claude until it stops using tools,
+        # or until the research budget is used up
+        research_done = False
+        for _ in range(MAX_ITERATIONS):
+            response = await _create_turn(
+                api,
+                **request_options,
+                model=research_model,
+                system=system,
                 tools=tools,
                 messages=messages,
             )
 
-            # Check if Claude wants to use tools
-            if response.stop_reason == "tool_use":
-                # Process all tool calls in this response
-                tool_results = []
-
-                for block in response.content:
-                    if block.type == "tool_use":
-                        tool_name = block.name
-                        tool_args = block.input
-
-                        print(f"  🔧 Tool: {tool_name}")
-                        if "query" in tool_args:
-                            print(f"     Query: {tool_args['query']}")
-                        if "paper_id" in tool_args:
-                            print(f"     Paper: {tool_args['paper_id']}")
-
-                        # Execute the tool via MCP
-                        result = await mcp.call_tool(tool_name, tool_args)
-
-                        # Truncate very long results for logging
-                        result_preview = result[:200] + "..." if len(result) > 200 else result
-                        print(f"     Result: {result_preview}")
-
-                        tool_results.append(
-                            {
-                                "type": "tool_result",
-                                "tool_use_id": block.id,
-                                "content": result,
-                            }
-                        )
-
-                # Add Claude's response and tool results to conversation
-                messages.append({"role": "assistant", "content": response.content})
-                messages.append({"role": "user", "content": tool_results})
-
-            else:
-                # Claude is done with tools — extract the final text response
-                for block in response.content:
-                    if hasattr(block, "text"):
-                        return block.text
-
-                # Fallback if no text block found
-                return "Error: No script generated"
+            messages.append({"role": "assistant", "content": response.content})
+            input_tokens += _prompt_tokens(response.usage)
+
+            # Code execution runs in a container that must be reused by
+            # every later turn of this conversation
+            if programmatic and response.container:
+                request_options["container"] = response.container.id
+
+            # A long-running server tool (code execution) paused the turn;
+            # send the conversation back as-is so Claude can continue
+            if response.stop_reason == "pause_turn":
+                continue
+
+            # Run all tool calls from this response concurrently: they are
+            # independent, so the turn takes as long as the slowest call
+            calls = [block for block in response.content if block.type == "tool_use"]
+
+            # A tool_use stop without tool_use blocks leaves nothing to
+            # answer; an empty user turn would only cost an extra round-trip
+            if response.stop_reason != "tool_use" or not calls:
+                research_done = True
+                break
+
+            for block in calls:
+                logger.debug(
+                    "Tool call %s: %s",
+                    block.name,
+                    block.input,
+                    extra={"tool": block.name, "tool_input": block.input},
+                )
+                yield ScriptEvent(type="tool", data=block.name)
+
+            results = await _run_tools(mcp, calls, use_cache, seen_results)
+
+            tool_results = []
+            for block, result in zip(calls, results):
+                # %.200s: only the start of long results is logged
+                logger.debug(
+                    "Tool result %s: %.200s",
+                    block.name,
+                    result,
+                    extra={"tool": block.name, "result_chars": len(result)},
+                )
+
+                tool_results.append(
+                    {
+                        "type": "tool_result",
+                        "tool_use_id": block.id,
+                        # Programmatic results go to Claude's code, not the
+                        # context window, so they are passed on in full
+                        "content": result if programmatic else _truncate_result(result),
+                    }
+                )
+
+            # (Programmatic tool results never reach the context, so there
+            # is nothing to cache there)
+            if not programmatic:
+                if history_breakpoint is not None:
+                    del history_breakpoint["cache_control"]
+                history_breakpoint = tool_results[-1]
+                history_breakpoint["cache_control"] = _CACHE_CONTROL
+
+            # Add tool results to the conversation. All results of a turn
+            # must go back in one user message that directly answers the
+            # assistant turn; per-tool messages cost round-trips or a 400.
+            assert all(result["type"] == "tool_result" for result in tool_results)
+            assert messages[-1]["role"] != "user"
+            messages.append({"role": "user", "content": tool_results})
+
+            if input_tokens >= MAX_TOTAL_INPUT_TOKENS:
+                logger.warning(
+                    "Token budget reached (%d input tokens)",
+                    input_tokens,
+                    extra={"input_tokens": input_tokens},
+                )
+                break
+        else:
+            logger.warning(
+                "Iteration budget reached (%d turns)",
+                MAX_ITERATIONS,
+                extra={"iterations": MAX_ITERATIONS},
+            )
+
+        # Writing phase: stream the script on its own turn, without tools.
+        # Not wrapped in asyncio.timeout (the consumer's pace would count
+        # against it); the request timeout bounds stalls between chunks instead.
+        if research_done:
+            messages.append({"role": "user", "content": WRITE_PROMPT})
+        elif not programmatic:
+            # The budget cut research short: the last tool results are still
+            # unanswered, and the write request has to share their user turn
+            messages[-1]["content"].append({"type": "text", "text": BUDGET_WRITE_PROMPT})
+        else:
+            # Claude's code is still running, and a turn answering its tool
+            # calls may only hold tool_result blocks: let the code finish
+            # first, then ask for the script on a turn of its own
+            await _finish_code_execution(
+                api,
+                messages,
+                request_options,
+                model=research_model,
+                system=system,
+                tools=tools,
+            )
+            messages.append({"role": "user", "content": BUDGET_WRITE_PROMPT})
+
+        # Prompt caches are per model, so when the writing turn runs on a
+        # different model it can't read the research turns' cache. It is that
+        # model's only turn, so caching the history would pay the cache-write
+        # premium on up to MAX_TOTAL_INPUT_TOKENS for an entry never read
+        # again: drop the history breakpoint. The system + tools breakpoints
+        # stay, since that prefix is shared across generations.
+        if writing_model != research_model and history_breakpoint is not None:
+            del history_breakpoint["cache_control"]
+
+        async with api.stream(
+            **request_options,
+            model=writing_model,
+            system=system,
+            tools=tools,  # Required because the history contains tool_use blocks
+            tool_choice={"type": "none"},
+            messages=messages,
+        ) as stream:
+            async for text in stream.text_stream:
+                yield ScriptEvent(type="delta", data=text)
+
+
+async def _create_turn(api, **options) -> anthropic.types.Message:
+    """Run one (non-streamed) research turn.
+
+    Timed-out attempts are retried by the client itself (see _get_client).
+
+    Args:
+        api: client.messages, or client.beta.messages in programmatic mode
+        **options: Messages API parameters (model, messages, tools, ...)
+
+    Returns:
+        Claude's response
+
+    Raises:
+        LLMTimeoutError: If the turn times out on every attempt
+    """
+    try:
+        return await api.create(**options)
+    except anthropic.APITimeoutError:
+        raise LLMTimeoutError(
+            f"Claude did not respond within {settings.llm_timeout_s}s "
+            f"({settings.timeout_max_retries + 1} attempts)"
+        ) from None
+
+
+async def _finish_code_execution(
+    api,
+    messages: list[dict],
+    request_options: dict,
+    **options,
+) -> None:
+    """Let Claude's code run to completion once the research budget is used up.
+
+    In programmatic mode the budget can run out while code execution is
+    paused or waiting on the tool results just sent. The code is resumed,
+    and any further tool call it makes is answered with BUDGET_TOOL_RESULT
+    instead of being executed, until Claude ends the turn.
+
+    Args:
+        api: client.beta.messages
+        messages: Conversation so far; Claude's turns and the refused tool
+                  results are appended to it
+        request_options: Options shared by every turn; its container id is
+                         kept up to date for the writing turn
+        **options: The other research turn parameters (model, system, tools)
+
+    Raises:
+        LLMTimeoutError: If a turn times out on every attempt
+        RuntimeError: If the code is still running after MAX_ITERATIONS turns
+    """
+    for _ in range(MAX_ITERATIONS):
+        response = await _create_turn(api, **request_options, **options, messages=messages)
+        messages.append({"role": "assistant", "content": response.content})
+        if response.container:
+            request_options["container"] = response.container.id
+
+        if response.stop_reason == "pause_turn":
+            continue
+
+        calls = [block for block in response.content if block.type == "tool_use"]
+        if response.stop_reason != "tool_use" or not calls:
+            return
+
+        messages.append(
+            {
+                "role": "user",
+                "content": [
+                    {
+                        "type": "tool_result",
+                        "tool_use_id": block.id,
+                        "content": BUDGET_TOOL_RESULT,
+                        "is_error": True,
+                    }
+                    for block in calls
+                ],
+            }
+        )
+
+    raise RuntimeError("Code execution did not finish after the research budget ran out")
+
+
+async def _get_claude_tools(mcp: ArxivMCPClient) -> list[dict]:
+    """Return the MCP server's tools prepared for Claude, built once per client.
+
+    Prompt caching: the tools are the same on every turn, so the last one
+    is marked as a cached prefix. They get their own breakpoint (separate
+    from the system prompt's) because they are also identical across
+    generations with different durations. The prefix is only long enough
+    to be cached on Sonnet (1024-token minimum), i.e. on the writing turn
+    and in programmatic mode; Haiku research turns need 4096 tokens.
+
+    Args:
+        mcp: Connected MCP client
+
+    Returns:
+        Tool definitions for the Messages API (always the same list object
+        for a given client; don't modify it)
+    """
+    tools = _claude_tools.get(mcp)
+    if tools is not None:
+        return tools
+
+    tools = await mcp.list_tools()
+    tools = [*tools[:-1], {**tools[-1], "cache_control": _CACHE_CONTROL}]
+    if settings.programmatic_tool_calling:
+        # Tools may only be called from Claude's sandboxed code, so raw
+        # tool output (e.g. full papers) never enters the context window
+        tools = [
+            CODE_EXECUTION_TOOL,
+            *({**tool, "allowed_callers": [CODE_EXECUTION_TOOL["type"]]} for tool in tools),
+        ]
+
+    _claude_tools[mcp] = tools
+    return tools
+
+
+def _prompt_tokens(usage: anthropic.types.Usage) -> int:
+    """Count every input token of a turn, including cached ones.
+
+    With prompt caching, usage.input_tokens only covers the uncached tail
+    of the prompt, so the cache reads/writes are added back in.
+    """
+    return (
+        usage.input_tokens
+        + (usage.cache_read_input_tokens or 0)
+        + (usage.cache_creation_input_tokens or 0)
+    )
+
+
+def _truncate_result(text: str, max_chars: int = MAX_TOOL_RESULT_CHARS) -> str:
+    """Shorten a tool result to about max_chars characters.
+
+    Keeps the opening of the text in full (for a paper: title, abstract
+    and introduction), then the heading and first SECTION_PREVIEW_CHARS
+    of each later section while they fit, so Claude still sees the
+    paper's structure and what every section is about.
+
+    Args:
+        text: The tool result
+        max_chars: Results up to this length are returned unchanged
+
+    Returns:
+        The result, or its shortened version ending with a truncation note
+    """
+    if len(text) <= max_chars:
+        return text
+
+    # Section starts after the opening; without any, keep a longer opening
+    starts = [match.start() for match in _HEADING.finditer(text, max_chars // 2)]
+    head = text[: max_chars // 2 if starts else max_chars]
+
+    parts = [head]
+    size = len(head)
+    for start, end in zip(starts, [*starts[1:], len(text)]):
+        preview = text[start:min(end, start + SECTION_PREVIEW_CHARS)].rstrip()
+        if size + len(preview) > max_chars:
+            break
+        parts.append(preview)
+        size += len(preview)
+
+    parts.append(f"[Truncated: showing {size} of {len(text)} characters]")
+    return "\n\n".join(parts)
+
+
+async def _run_tools(
+    mcp: ArxivMCPClient,
+    calls: list[anthropic.types.ToolUseBlock],
+    use_cache: bool,
+    seen_results: dict[str, str],
+) -> list[str]:
+    """Execute tool calls via MCP, serving repeats and cacheable ones locally.
+
+    A call identical to one made earlier in this generation gets the
+    earlier result, and cacheable tools are looked up on disk; the
+    remaining calls run concurrently in one batch, where identical calls
+    from the same turn run only once and share the result. Fresh results of
+    cacheable tools are written back to disk. A call that times out gets
+    TOOL_TIMEOUT_RESULT instead, and a call the tool reports as failed
+    gets the tool's error text; neither is ever cached or memoized, so a
+    transient arXiv failure isn't replayed to later calls.
+
+    Args:
+        mcp: Connected MCP client
+        calls: tool_use blocks from Claude's response
+        use_cache: Whether to read from the disk cache (writes always happen)
+        seen_results: Results of this generation's earlier calls, by call
+                      key; updated with the results of `calls`
+
+    Returns:
+        Tool results, in the same order as `calls`
+    """
+    keys = [SearchCache.make_key(block.name, block.input) for block in calls]
+
+    results: list[str | None] = [seen_results.get(key) for key in keys]
+    if use_cache:
+        for i, (block, key) in enumerate(zip(calls, keys)):
+            if results[i] is None and block.name in CACHED_TOOLS:
+                results[i] = await search_cache.get(key)
+                if results[i] is not None:
+                    seen_results[key] = results[i]
+
+    # Unanswered calls by key, so duplicates within this turn collapse
+    misses = {key: block for key, block, result in zip(keys, calls, results) if result is None}
+    fetched = await mcp.call_tools_batch(
+        [(block.name, block.input) for block in misses.values()]
+    )
+
+    # Failed calls are answered for this turn only
+    failures: dict[str, str] = {}
+    for (key, block), result in zip(misses.items(), fetched):
+        if isinstance(result, MCPTimeoutError):
+            failures[key] = TOOL_TIMEOUT_RESULT.format(timeout_s=settings.mcp_timeout_s)
+        elif isinstance(result, Exception):
+            failures[key] = str(result)
+        else:
+            seen_results[key] = result
+            if block.name in CACHED_TOOLS:
+                await search_cache.set(key, result)
+
+    return [
+        result if result is not None else failures.get(key, seen_results.get(key))
+        for key, result in zip(keys, results)
+    ]
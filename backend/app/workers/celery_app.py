@@ -0,0 +1,40 @@
+"""Celery Application
+
+This module configures the Celery app used to run podcast generation in
+the background, outside of the HTTP request/response cycle.
+
+Why a task queue:
+    - Generating a script takes tens of seconds (Claude + MCP research)
+    - Holding an HTTP connection that long hits proxy timeouts and ties up
+      Uvicorn workers
+    - The API enqueues a job and returns immediately; clients poll for the result
+
+Usage:
+    # Start a worker (from the backend/ directory)
+    uv run celery -A app.workers.celery_app worker --loglevel=info
+
+Dependencies:
+    - celery: Distributed task queue
+    - redis: Used as both message broker and result backend
+    - app.core.config: For the Redis URL
+"""
+
+from celery import Celery
+
+from app.core.config import settings
+
+
+celery_app = Celery(
+    "podcast_generator",
+    broker=settings.redis_url,
+    backend=settings.redis_url,
+    include=["app.workers.tasks"],
+)
+
+celery_app.conf.update(
+    task_serializer="json",
+    result_serializer="json",
+    accept_content=["json"],
+    task_track_started=True,  # Report STARTED so clients can tell queued from running
+    result_expires=60 * 60 * 24,  # Keep results for a day
+)
@@ -0,0 +1,85 @@
+"""Background Tasks
+
+Celery tasks that wrap the async generation services so they can run
+in a worker process instead of inside an HTTP request.
+
+Usage:
+    from app.workers.tasks import generate_script_task
+
+    task = generate_script_task.delay("machine learning", 5)
+    task.id  # Job ID to poll via GET /api/generate/{job_id}
+
+Dependencies:
+    - app.workers.celery_app: The configured Celery app
+    - app.services.script_generator: Agentic script generation with MCP
+    - app.services.mcp_client: The per-process shared MCP server
+
+Notes:
+    - Each worker process starts one arXiv MCP server on its first task and
+      reuses it for every later task; it is stopped when the process exits
+"""
+
+import asyncio
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+from celery.signals import worker_process_shutdown
+
+from app.services.mcp_client import close_mcp
+from app.services.research.rate_limit import close_rate_limit
+from app.services.script_generator import generate_script
+from app.workers.celery_app import celery_app
+
+
+T = TypeVar("T")
+
+# One event loop per worker process, reused across tasks. asyncio.run()
+# would create and close a loop per task, breaking module-level async
+# clients (e.g. the shared Anthropic client) whose connection pools are
+# bound to the loop they first ran on. Created lazily so each forked
+# worker process gets its own.
+_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on this worker process's persistent event loop."""
+    global _loop
+    if _loop is None:
+        _loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_loop)
+    return _loop.run_until_complete(coro)
+
+
+@worker_process_shutdown.connect
+def _shutdown_worker_process(**kwargs) -> None:
+    """Release this worker process's shared MCP server and Redis client before it exits."""
+    if _loop is not None:
+        _loop.run_until_complete(close_mcp())
+        _loop.run_until_complete(close_rate_limit())
+
+
+@celery_app.task(name="generate_script")
+def generate_script_task(topic: str, duration_minutes: int) -> dict:
+    """Generate a podcast script in the background.
+
+    Celery tasks are synchronous, so the async generator is driven on
+    the worker's persistent event loop.
+
+    Args:
+        topic: The research topic
+        duration_minutes: Target duration in minutes
+
+    Returns:
+        Dict with topic, duration_minutes, script and word_count
+        (JSON-serializable so it can be stored in the result backend)
+    """
+    script = _run_async(
+        generate_script(topic=topic, duration_minutes=duration_minutes)
+    )
+
+    return {
+        "topic": topic,
+        "duration_minutes": duration_minutes,
+        "script": script,
+        "word_count": len(script.split()),
+    }
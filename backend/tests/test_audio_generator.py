@@ -0,0 +1,56 @@
+from app.services.audio_generator import _split_script
+
+
+SCRIPT = (
+    "Welcome to the show. Today we talk about transformers!\n\n"
+    "Attention lets every token look at every other token. "
+    "That costs quadratic time in the sequence length. "
+    "Several papers try to make it cheaper?\n\n"
+    "Thanks for listening."
+)
+
+
+def test_short_script_is_one_chunk():
+    assert _split_script(SCRIPT) == [SCRIPT]
+
+
+def test_chunks_respect_max_chars():
+    chunks = _split_script(SCRIPT, max_chars=60)
+
+    assert len(chunks) > 1
+    assert all(0 < len(chunk) <= 60 for chunk in chunks)
+
+
+def test_chunks_rejoin_to_the_same_words():
+    chunks = _split_script(SCRIPT, max_chars=60)
+
+    assert " ".join(chunks).split() == SCRIPT.split()
+
+
+def test_sentences_are_not_cut_in_half():
+    chunks = _split_script(SCRIPT, max_chars=60)
+
+    # Every chunk of this script ends on a sentence boundary
+    assert all(chunk[-1] in ".!?" for chunk in chunks)
+
+
+def test_fitting_paragraphs_are_packed_together():
+    text = "First paragraph.\n\nSecond paragraph.\n\nThird paragraph."
+
+    assert _split_script(text, max_chars=40) == [
+        "First paragraph.\n\nSecond paragraph.",
+        "Third paragraph.",
+    ]
+
+
+def test_oversized_sentence_is_split_on_whitespace():
+    sentence = " ".join(f"word{i}" for i in range(40))
+
+    chunks = _split_script(sentence, max_chars=50)
+
+    assert all(len(chunk) <= 50 for chunk in chunks)
+    assert " ".join(chunks).split() == sentence.split()
+
+
+def test_blank_paragraphs_are_dropped():
+    assert _split_script("\n\nOnly one.\n\n\n\n") == ["Only one."]
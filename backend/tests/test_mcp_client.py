@@ -0,0 +1,29 @@
+import pytest
+
+from app.services.mcp_client import _is_error_text
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Error: Paper 2401.12345 not found",
+        '{"status": "error", "message": "arXiv unreachable"}',
+        '{"status": "rate_limited", "retry_after": 3}',
+    ],
+)
+def test_error_output_is_detected(text):
+    assert _is_error_text(text)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        '{"status": "success", "papers": []}',
+        '{"total_results": 0, "papers": []}',
+        "# Attention Is All You Need\n\nError: is just a word here",
+        "{not json",
+        "",
+    ],
+)
+def test_normal_output_is_not_an_error(text):
+    assert not _is_error_text(text)
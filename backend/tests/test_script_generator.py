@@ -0,0 +1,97 @@
+import asyncio
+import re
+
+from app.services import script_generator
+from app.services.script_generator import (
+    ScriptEvent,
+    _truncate_result,
+    stream_script_sentences,
+)
+
+
+_NOTE = re.compile(r"\[Truncated: showing (\d+) of (\d+) characters\]$")
+
+
+def _paper(sections: int, section_chars: int) -> str:
+    opening = "Title\n\nAbstract. " + "a" * 2_000
+    body = "\n\n".join(
+        f"## Section {i}\n\n" + "b" * section_chars for i in range(sections)
+    )
+    return f"{opening}\n\n{body}"
+
+
+def test_short_result_is_unchanged():
+    assert _truncate_result("short result", max_chars=100) == "short result"
+
+
+def test_truncated_result_fits_the_limit_and_says_so():
+    text = _paper(sections=40, section_chars=3_000)
+
+    result = _truncate_result(text, max_chars=10_000)
+
+    note = _NOTE.search(result)
+    assert note is not None
+    shown, total = map(int, note.groups())
+    assert total == len(text)
+    assert shown <= 10_000
+    # Kept parts plus the "\n\n" separators and the note itself
+    assert len(result) <= 10_000 + 2 * result.count("\n\n") + len(note.group())
+
+
+def test_truncation_keeps_the_opening_and_section_headings():
+    text = _paper(sections=10, section_chars=3_000)
+
+    result = _truncate_result(text, max_chars=10_000)
+
+    assert result.startswith(text[:5_000])
+    assert "## Section 9" in result
+
+
+def test_truncation_without_headings_keeps_a_longer_opening():
+    text = "x" * 50_000
+
+    result = _truncate_result(text, max_chars=10_000)
+
+    assert result.startswith("x" * 10_000 + "\n\n[Truncated: showing 10000 of 50000")
+
+
+def _sentences(monkeypatch, deltas: list[str]) -> list[str]:
+    async def fake_stream_script(*args):
+        yield ScriptEvent(type="tool", data="search_papers")
+        for delta in deltas:
+            yield ScriptEvent(type="delta", data=delta)
+
+    monkeypatch.setattr(script_generator, "stream_script", fake_stream_script)
+
+    async def collect():
+        return [sentence async for sentence in stream_script_sentences("topic")]
+
+    return asyncio.run(collect())
+
+
+def test_sentences_are_split_on_sentence_ends(monkeypatch):
+    deltas = ["Hello world. This is", " a test! Is it? Yes"]
+
+    sentences = _sentences(monkeypatch, deltas)
+
+    assert sentences == ["Hello world. ", "This is a test! ", "Is it? ", "Yes"]
+
+
+def test_whitespace_split_across_deltas_stays_with_its_sentence(monkeypatch):
+    deltas = ["Hello world.", " ", "\nNext one! Last", " bit?"]
+
+    sentences = _sentences(monkeypatch, deltas)
+
+    assert sentences == ["Hello world. \n", "Next one! ", "Last bit?"]
+    assert "".join(sentences) == "".join(deltas)
+
+
+def test_sentences_rejoin_to_the_script(monkeypatch):
+    script = "One. Two!\n\nThree? Four...   Five.\n"
+    # One character per delta: every boundary falls inside a delta run
+    deltas = list(script)
+
+    sentences = _sentences(monkeypatch, deltas)
+
+    assert "".join(sentences) == script
+    assert sentences[0] == "One. "
@@ -0,0 +1,46 @@
+import asyncio
+import time
+
+from app.services.research.search_cache import SearchCache
+
+
+def test_set_then_get(tmp_path):
+    cache = SearchCache(tmp_path / "cache.sqlite3", ttl_s=60)
+
+    async def roundtrip():
+        await cache.set("key", "value")
+        return await cache.get("key"), await cache.get("missing")
+
+    assert asyncio.run(roundtrip()) == ("value", None)
+
+
+def test_entries_expire_after_ttl(tmp_path, monkeypatch):
+    cache = SearchCache(tmp_path / "cache.sqlite3", ttl_s=60)
+    asyncio.run(cache.set("key", "value"))
+    now = time.time()
+
+    monkeypatch.setattr(time, "time", lambda: now + 59)
+    assert asyncio.run(cache.get("key")) == "value"
+
+    monkeypatch.setattr(time, "time", lambda: now + 61)
+    assert asyncio.run(cache.get("key")) is None
+
+
+def test_setting_again_refreshes_the_entry(tmp_path, monkeypatch):
+    cache = SearchCache(tmp_path / "cache.sqlite3", ttl_s=60)
+    asyncio.run(cache.set("key", "old"))
+    now = time.time()
+
+    monkeypatch.setattr(time, "time", lambda: now + 50)
+    asyncio.run(cache.set("key", "new"))
+    monkeypatch.setattr(time, "time", lambda: now + 100)
+
+    assert asyncio.run(cache.get("key")) == "new"
+
+
+def test_key_covers_all_arguments_in_any_order():
+    key = SearchCache.make_key("search_papers", {"query": "llm", "max_results": 5})
+
+    assert key == SearchCache.make_key("search_papers", {"max_results": 5, "query": "llm"})
+    assert key != SearchCache.make_key("search_papers", {"query": "llm", "max_results": 10})
+    assert key != SearchCache.make_key("read_paper", {"query": "llm", "max_results": 5})
@@ -96,6 +96,7 @@ function App() {
                   type="text"
                   value={topic}
                   onChange={(e) => setTopic(e.target.value)}
+                  maxLength={200}
                   placeholder="e.g., Transformer architectures, SAM3, Quantum computing..."
                   className="form-input"
                   disabled={isGenerating}
@@ -8,16 +8,54 @@
  * - Framework-agnostic
  */
 
-import type { GenerateRequest, GenerateResponse } from '../types/podcast';
+import type {
+  GenerateJobResponse,
+  GenerateRequest,
+  GenerateResponse,
+  GenerateStatusResponse,
+} from '../types/podcast';
 
 const API_BASE = 'http://localhost:8000';
 
+/** How often to poll a running generation job */
+const POLL_INTERVAL_MS = 2000;
+
+/**
+ * How long to keep polling before giving up. The backend reports unknown
+ * (e.g. expired or lost) jobs as pending, so without a deadline a job that
+ * never finishes would be polled forever.
+ */
+const MAX_POLL_WAIT_MS = 10 * 60 * 1000;
+
+/**
+ * Parse a JSON response, throwing the backend's error detail on failure
+ *
+ * Validation errors (422) carry `detail` as a list of `{ msg, ... }` entries
+ * rather than a string; their messages are joined into one.
+ */
+async function parseResponse<T>(response: Response): Promise<T> {
+  if (!response.ok) {
+    const error = await response.json().catch(() => ({ detail: 'Unknown error' }));
+    const detail = Array.isArray(error.detail)
+      ? error.detail.map((d: { msg: string }) => d.msg).join('; ')
+      : error.detail;
+    throw new Error(detail || `HTTP ${response.status}`);
+  }
+
+  return response.json();
+}
+
 /**
  * Generate a podcast script for the given topic
  *
+ * The backend runs generation as a background job: this enqueues the job,
+ * then polls its status until the script is ready or MAX_POLL_WAIT_MS
+ * has passed.
+ *
  * @param request - Topic and duration configuration
  * @returns The generated script and metadata
- * @throws Error if the request fails
+ * @throws Error if the request fails, the job fails, or the job doesn't
+ *   finish in time
  */
 export async function generatePodcast(
   request: GenerateRequest
@@ -30,10 +68,26 @@ export async function generatePodcast(
     body: JSON.stringify(request),
   });
 
-  if (!response.ok) {
-    const error = await response.json().catch(() => ({ detail: 'Unknown error' }));
-    throw new Error(error.detail || `HTTP ${response.status}`);
+  const { job_id } = await parseResponse<GenerateJobResponse>(response);
+
+  const deadline = Date.now() + MAX_POLL_WAIT_MS;
+
+  while (Date.now() < deadline) {
+    await new Promise((resolve) => setTimeout(resolve, POLL_INTERVAL_MS));
+
+    const job = await parseResponse<GenerateStatusResponse>(
+      await fetch(`${API_BASE}/api/generate/${job_id}`)
+    );
+
+    if (job.status === 'succeeded' && job.result) {
+      return job.result;
+    }
+    if (job.status === 'failed') {
+      throw new Error(job.error || 'Generation failed');
+    }
   }
 
-  return response.json();
+  throw new Error(
+    `Generation did not finish within ${MAX_POLL_WAIT_MS / 60000} minutes`
+  );
 }
@@ -13,3 +13,16 @@ export interface GenerateResponse {
   script: string;
   word_count: number;
 }
+
+export interface GenerateJobResponse {
+  job_id: string;
+}
+
+export type GenerateJobStatus = 'pending' | 'running' | 'succeeded' | 'failed';
+
+export interface GenerateStatusResponse {
+  job_id: string;
+  status: GenerateJobStatus;
+  result: GenerateResponse | null;
+  error: string | null;
+}